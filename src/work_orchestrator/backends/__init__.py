@@ -20,8 +20,13 @@ class AgentBackend(Protocol):
         permission_mode: str | None = None,
         output_format: str | None = None,
         mcp_config_path: str | None = None,
+        prompt_file: str | None = None,
     ) -> list[str]:
-        """Return the full subprocess command list for background mode."""
+        """Return the full subprocess command list for background mode.
+
+        A backend that can read the prompt from stdin writes it to prompt_file
+        and leaves it out of the command; the caller feeds that file as stdin.
+        """
         ...
 
     def build_terminal_command(
@@ -21,8 +21,15 @@ class ClaudeCodeBackend:
         permission_mode: str | None = None,
         output_format: str | None = None,
         mcp_config_path: str | None = None,
+        prompt_file: str | None = None,
     ) -> list[str]:
-        cmd = ["claude", "-p", prompt, "--output-format", output_format or "json"]
+        if prompt_file:
+            # Passed on stdin, keeping large prompts out of argv
+            Path(prompt_file).write_text(prompt)
+            cmd = ["claude", "-p", "-"]
+        else:
+            cmd = ["claude", "-p", prompt]
+        cmd += ["--output-format", output_format or "json"]
         if model:
             cmd += ["--model", model]
         if max_budget:
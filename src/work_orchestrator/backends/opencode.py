@@ -21,6 +21,7 @@ class OpenCodeBackend:
         permission_mode: str | None = None,
         output_format: str | None = None,
         mcp_config_path: str | None = None,
+        prompt_file: str | None = None,
     ) -> list[str]:
         cmd = ["opencode", "run", prompt, "--format", "json", "--quiet"]
         if model:
@@ -37,7 +38,13 @@ class OpenCodeBackend:
         mcp_config_path: str | None = None,
         prompt_file: str | None = None,
     ) -> str:
-        parts = ["opencode", "run", shlex.quote(prompt)]
+        if prompt_file:
+            # opencode only takes the prompt as an argument; expand it from the
+            # file so the script never embeds (or quotes) the prompt itself
+            Path(prompt_file).write_text(prompt)
+            parts = ["opencode", "run", f'"$(cat {shlex.quote(prompt_file)})"']
+        else:
+            parts = ["opencode", "run", shlex.quote(prompt)]
         if model:
             parts += ["--model", model]
         return " ".join(parts)
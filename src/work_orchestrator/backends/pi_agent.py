@@ -21,6 +21,7 @@ class PiAgentBackend:
         permission_mode: str | None = None,
         output_format: str | None = None,
         mcp_config_path: str | None = None,
+        prompt_file: str | None = None,
     ) -> list[str]:
         cmd = ["pi", "-p", prompt, "--no-session"]
         if model:
@@ -37,7 +38,13 @@ class PiAgentBackend:
         mcp_config_path: str | None = None,
         prompt_file: str | None = None,
     ) -> str:
-        parts = ["pi", "-p", shlex.quote(prompt), "--no-session"]
+        if prompt_file:
+            # pi only takes the prompt as an argument; expand it from the file
+            # so the script never embeds (or quotes) the prompt itself
+            Path(prompt_file).write_text(prompt)
+            parts = ["pi", "-p", f'"$(cat {shlex.quote(prompt_file)})"', "--no-session"]
+        else:
+            parts = ["pi", "-p", shlex.quote(prompt), "--no-session"]
         if model:
             parts += ["--model", model]
         return " ".join(parts)
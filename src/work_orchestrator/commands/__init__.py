@@ -0,0 +1,22 @@
+"""CLI command modules, loaded on demand by work_orchestrator.cli.
+
+Each module holds one top-level command or command group. Core modules, the
+DB engine and integrations are imported inside each command so that
+`wo <cmd>` only pays for the modules that command actually uses.
+"""
+
+from work_orchestrator.config import get_config
+
+
+def get_db(config=None, readonly=False):
+    """Check out a connection from the process-wide pool for the configured DB.
+
+    Read-only commands pass readonly=True to use one of the pool's read-only
+    connections; everything else gets the single writer. Commands that
+    already loaded the config pass it in to avoid re-reading it.
+    """
+    from work_orchestrator.db.pool import get_pool
+
+    config = config or get_config()
+    pool = get_pool(config.db_path)
+    return pool.get_reader() if readonly else pool.get_writer()
@@ -0,0 +1,236 @@
+"""Agent commands (`wo agent ...`)."""
+
+import sys
+
+import click
+
+from work_orchestrator.commands import get_db
+from work_orchestrator.config import get_config
+
+
+@click.group("agent")
+def agent_group():
+    """Manage Claude sub-agents."""
+    pass
+
+
+@agent_group.command("register")
+@click.argument("project")
+def agent_register(project):
+    """Auto-discover and register worktree slots for a project."""
+    from work_orchestrator.core import agents as agents_mod
+    from work_orchestrator.core import projects as projects_mod
+
+    with get_db() as db:
+        proj = projects_mod.get_project(db, project)
+        if not proj:
+            click.echo(f"Project not found: {project}", err=True)
+            sys.exit(1)
+        slots = agents_mod.discover_and_register_worktrees(db, project, proj.repo_path)
+        if not slots:
+            click.echo("No new worktrees to register.")
+            return
+        for s in slots:
+            click.echo(f"  Registered: {s.label} -> {s.path} ({s.branch})")
+
+
+@agent_group.command("slots")
+@click.argument("project")
+@click.option("--status", default=None, help="Filter: available or occupied")
+def agent_slots(project, status):
+    """List worktree slots for a project."""
+    from work_orchestrator.core import agents as agents_mod
+
+    with get_db(readonly=True) as db:
+        slots = agents_mod.list_worktree_slots(db, project, status=status)
+        if not slots:
+            click.echo("No slots found.")
+            return
+        lines = []
+        for s in slots:
+            task_info = f" [task: {s.current_task_id}]" if s.current_task_id else ""
+            lines.append(f"  [{s.status}] {s.label}: {s.path}{task_info}")
+        click.echo("\n".join(lines))
+
+
+@agent_group.command("assign")
+@click.argument("task_id")
+@click.argument("slot_label")
+@click.option("--project", default="default")
+def agent_assign(task_id, slot_label, project):
+    """Assign a task to a worktree slot."""
+    from work_orchestrator.core import agents as agents_mod
+
+    with get_db() as db:
+        slot = agents_mod.get_slot_by_label(db, project, slot_label)
+        if not slot:
+            click.echo(f"Slot not found: {slot_label}", err=True)
+            sys.exit(1)
+        try:
+            updated = agents_mod.assign_task_to_slot(db, task_id, slot.id)
+            click.echo(f"Assigned {task_id} to slot '{updated.label}' ({updated.path})")
+        except ValueError as e:
+            click.echo(f"Error: {e}", err=True)
+            sys.exit(1)
+
+
+@agent_group.command("release")
+@click.argument("slot_label")
+@click.option("--project", default="default", help="Project ID")
+def agent_release(slot_label, project):
+    """Release a worktree slot, making it available for new tasks."""
+    from work_orchestrator.core import agents as agents_mod
+
+    with get_db() as db:
+        slot = agents_mod.get_slot_by_label(db, project, slot_label)
+        if not slot:
+            click.echo(f"Slot not found: {slot_label}", err=True)
+            sys.exit(1)
+        try:
+            updated = agents_mod.release_slot(db, slot.id)
+            click.echo(f"Released slot '{updated.label}' ({updated.path})")
+        except ValueError as e:
+            click.echo(f"Error: {e}", err=True)
+            sys.exit(1)
+
+
+@agent_group.command("launch")
+@click.argument("task_id")
+@click.argument("instructions")
+@click.option("--model", default=None, help="Model: sonnet or opus")
+@click.option("--max-budget", type=float, default=None, help="Max budget in USD")
+def agent_launch(task_id, instructions, model, max_budget):
+    """Launch a Claude sub-agent for a task (must be assigned to a slot first)."""
+    from work_orchestrator.core import agents as agents_mod
+
+    config = get_config()
+    with get_db(config) as db:
+        m = model or config.agent_default_model
+        b = max_budget or config.agent_default_budget
+        try:
+            run = agents_mod.launch_agent(
+                db, task_id, instructions,
+                output_dir=config.agent_output_dir,
+                model=m, max_budget=b,
+            )
+            click.echo(f"Agent launched for task '{task_id}'")
+            click.echo(f"  PID: {run.pid}")
+            click.echo(f"  Model: {run.model}")
+            click.echo(f"  Output: {run.output_file}")
+        except ValueError as e:
+            click.echo(f"Error: {e}", err=True)
+            sys.exit(1)
+
+
+@agent_group.command("delegate")
+@click.argument("task_id")
+@click.argument("instructions")
+@click.option("--model", default=None, help="Model: sonnet or opus")
+@click.option("--max-budget", type=float, default=None, help="Max budget in USD")
+@click.option("--max-turns", type=int, default=None, help="Max tool-use turns (default 25)")
+@click.option("--slot", default=None, help="Specific worktree slot label")
+@click.option("--project", default=None, help="Project ID (auto-detected from task)")
+@click.option("--terminal/--background", default=True, help="Open in Terminal window (default) or run in background")
+@click.option("--agent", "backend", default=None, help="Agent backend: claude-code, opencode, or pi")
+def agent_delegate(task_id, instructions, model, max_budget, max_turns, slot, project, terminal, backend):
+    """Delegate a task to a sub-agent (auto-picks slot, assigns, launches)."""
+    from work_orchestrator.core import agents as agents_mod
+
+    config = get_config()
+    with get_db(config) as db:
+        m = model or config.agent_default_model
+        b = max_budget or config.agent_default_budget
+        t = max_turns or config.agent_default_max_turns
+        try:
+            run = agents_mod.delegate_task(
+                db, task_id, instructions,
+                output_dir=config.agent_output_dir,
+                project_id=project,
+                model=m,
+                max_budget=b,
+                max_turns=t,
+                slot_label=slot,
+                terminal=terminal,
+                backend=backend or config.default_backend,
+            )
+            mode = "Terminal window" if terminal else "background"
+            click.echo(f"Task '{task_id}' delegated to {mode}!")
+            click.echo(f"  Backend: {run.backend}")
+            click.echo(f"  PID: {run.pid}")
+            click.echo(f"  Model: {run.model}")
+            click.echo(f"  Max turns: {t}")
+            click.echo(f"  Output: {run.output_file}")
+        except ValueError as e:
+            click.echo(f"Error: {e}", err=True)
+            sys.exit(1)
+
+
+@agent_group.command("status")
+@click.argument("task_id")
+def agent_status_cmd(task_id):
+    """Check agent status for a task."""
+    from work_orchestrator.core import agents as agents_mod
+
+    with get_db(readonly=True) as db:
+        run = agents_mod.get_latest_agent_run(db, task_id)
+        if not run:
+            click.echo(f"No agent runs found for task: {task_id}")
+            return
+        click.echo(f"Agent run #{run.id} for task '{run.task_id}'")
+        click.echo(f"  Status: {run.status}")
+        click.echo(f"  PID: {run.pid}")
+        click.echo(f"  Model: {run.model}")
+        if run.started_at:
+            click.echo(f"  Started: {run.started_at}")
+        if run.completed_at:
+            click.echo(f"  Completed: {run.completed_at}")
+        if run.exit_code is not None:
+            click.echo(f"  Exit code: {run.exit_code}")
+        if run.result_summary:
+            click.echo(f"  Summary: {run.result_summary}")
+
+
+@agent_group.command("list")
+@click.option("--status", default=None, help="Filter: running, completed, failed, cancelled")
+@click.option("--project", default=None)
+def agent_list(status, project):
+    """List all agent runs."""
+    from work_orchestrator.core import agents as agents_mod
+
+    with get_db(readonly=True) as db:
+        runs = agents_mod.list_agent_runs(db, status=status, project_id=project)
+        if not runs:
+            click.echo("No agent runs found.")
+            return
+        click.echo("\n".join(
+            f"  [{run.status.upper()}] task={run.task_id} pid={run.pid} model={run.model}"
+            for run in runs
+        ))
+
+
+@agent_group.command("cancel")
+@click.argument("task_id")
+def agent_cancel(task_id):
+    """Cancel a running agent."""
+    from work_orchestrator.core import agents as agents_mod
+
+    with get_db() as db:
+        run = agents_mod.cancel_agent(db, task_id)
+        if not run:
+            click.echo(f"No running agent found for task: {task_id}", err=True)
+            sys.exit(1)
+        click.echo(f"Agent cancelled for task '{task_id}' (PID {run.pid})")
+
+
+@agent_group.command("output")
+@click.argument("task_id")
+def agent_output(task_id):
+    """Show the captured output of an agent run."""
+    from work_orchestrator.core import agents as agents_mod
+
+    with get_db(readonly=True) as db:
+        output = agents_mod.get_agent_output(db, task_id)
+        if not output:
+            click.echo(f"No output found for task: {task_id}", err=True)
+            sys.exit(1)
+        click.echo(output)
@@ -0,0 +1,18 @@
+"""MCP server commands (`wo mcp ...`)."""
+
+import click
+
+
+@click.group("mcp")
+def mcp_group():
+    """MCP server commands."""
+    pass
+
+
+@mcp_group.command("serve")
+def mcp_serve():
+    """Start the MCP server (stdio transport)."""
+    from work_orchestrator.mcp import prompts  # noqa: F401 - registers prompts
+    from work_orchestrator.mcp.server import mcp
+
+    mcp.run(transport="stdio")
@@ -0,0 +1,69 @@
+"""Memory commands (`wo memory ...`)."""
+
+import sys
+
+import click
+
+from work_orchestrator.commands import get_db
+
+
+@click.group("memory")
+def memory_group():
+    """Manage persistent memory."""
+    pass
+
+
+@memory_group.command("set")
+@click.argument("key")
+@click.argument("value")
+@click.option("--category", default="general", help="Memory category")
+def memory_set(key, value, category):
+    """Store a memory entry."""
+    from work_orchestrator.core import memory as memory_mod
+
+    with get_db() as db:
+        mem = memory_mod.remember(db, key, value, category)
+        click.echo(f"Stored: {mem.key} = {mem.value} [{mem.category}]")
+
+
+@memory_group.command("get")
+@click.argument("key")
+def memory_get(key):
+    """Retrieve a memory by key."""
+    from work_orchestrator.core import memory as memory_mod
+
+    with get_db(readonly=True) as db:
+        mem = memory_mod.recall_by_key(db, key)
+        if not mem:
+            click.echo(f"Not found: {key}", err=True)
+            sys.exit(1)
+        click.echo(f"{mem.key} = {mem.value} [{mem.category}]")
+
+
+@memory_group.command("search")
+@click.argument("query")
+@click.option("--category", default=None, help="Filter by category")
+def memory_search(query, category):
+    """Full-text search across memories."""
+    from work_orchestrator.core import memory as memory_mod
+
+    with get_db(readonly=True) as db:
+        mems = memory_mod.search_memories(db, query, category=category)
+        if not mems:
+            click.echo("No results.")
+            return
+        click.echo("\n".join(f"  {m.key} = {m.value} [{m.category}]" for m in mems))
+
+
+@memory_group.command("list")
+@click.option("--category", default=None, help="Filter by category")
+def memory_list(category):
+    """List all memories."""
+    from work_orchestrator.core import memory as memory_mod
+
+    with get_db(readonly=True) as db:
+        mems = memory_mod.list_memories(db, category=category)
+        if not mems:
+            click.echo("No memories stored.")
+            return
+        click.echo("\n".join(f"  {m.key} = {m.value} [{m.category}]" for m in mems))
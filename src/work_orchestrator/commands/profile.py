@@ -0,0 +1,35 @@
+"""Profile commands: setup and profile."""
+
+import click
+
+from work_orchestrator.commands import get_db
+
+
+@click.command("setup")
+@click.option("--name", prompt="Your name", help="Your name")
+@click.option("--language", prompt="Preferred language", default="", help="Communication language (e.g. English, 中文)")
+@click.option("--vibe", prompt="Vibe", default="", help="How you like interactions (e.g. chill, hype, professional)")
+def setup_profile(name, language, vibe):
+    """Set up your personal profile."""
+    from work_orchestrator.core import memory as memory_mod
+
+    with get_db() as db:
+        memory_mod.remember(db, "user_name", name, category="profile")
+        if language:
+            memory_mod.remember(db, "preferred_language", language, category="profile")
+        if vibe:
+            memory_mod.remember(db, "vibe", vibe, category="profile")
+        click.echo(f"Welcome, {name}! Profile saved.")
+
+
+@click.command("profile")
+def show_profile():
+    """Show your personal profile."""
+    from work_orchestrator.core import memory as memory_mod
+
+    with get_db(readonly=True) as db:
+        mems = memory_mod.list_memories(db, category="profile")
+        if not mems:
+            click.echo("No profile set up. Run: wo setup")
+            return
+        click.echo("\n".join(f"{m.key}={m.value}" for m in mems))
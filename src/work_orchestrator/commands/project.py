@@ -0,0 +1,46 @@
+"""Project commands: init and projects."""
+
+from pathlib import Path
+
+import click
+
+from work_orchestrator.commands import get_db
+
+
+@click.command("init")
+@click.argument("project_name")
+@click.option(
+    "--repo-path",
+    default=".",
+    type=click.Path(file_okay=False, resolve_path=True, path_type=Path),
+    help="Path to the git repository",
+)
+@click.option("--branch", default="main", help="Default branch name")
+@click.option("--slack-channel", default=None, help="Default Slack channel")
+def init_project(project_name, repo_path, branch, slack_channel):
+    """Initialize a new project."""
+    from work_orchestrator.core import projects as projects_mod
+    from work_orchestrator.core import tasks as tasks_mod
+
+    project_id = tasks_mod.slugify(project_name)
+
+    with get_db() as db:
+        project = projects_mod.create_project(
+            db, project_id, project_name, repo_path, branch, slack_channel
+        )
+        click.echo(f"Project created: {project.id} ({project.name})")
+        click.echo(f"  Repo: {project.repo_path}")
+        click.echo(f"  Branch: {project.default_branch}")
+
+
+@click.command("projects")
+def list_projects():
+    """List all projects."""
+    from work_orchestrator.core import projects as projects_mod
+
+    with get_db(readonly=True) as db:
+        projects = projects_mod.list_projects(db)
+        if not projects:
+            click.echo("No projects found.")
+            return
+        click.echo("\n".join(p.id for p in projects))
@@ -0,0 +1,60 @@
+"""Slack commands (`wo slack ...`)."""
+
+import sys
+
+import click
+
+from work_orchestrator.commands import get_db
+from work_orchestrator.config import get_config
+
+
+@click.group("slack")
+def slack_group():
+    """Slack integration commands."""
+    pass
+
+
+@slack_group.command("send")
+@click.argument("channel")
+@click.argument("message")
+def slack_send(channel, message):
+    """Send a message to a Slack channel."""
+    from work_orchestrator.integrations import slack as slack_mod
+
+    config = get_config()
+    try:
+        result = slack_mod.send_message(config.slack_bot_token, channel, message)
+        click.echo(f"Message sent to {result.channel} (ts: {result.ts})")
+    except slack_mod.SlackError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+@slack_group.command("status")
+@click.option("--project", default="default", help="Project ID")
+@click.option("--channel", default=None, help="Slack channel (uses project default if not set)")
+def slack_status(project, channel):
+    """Post a project status update to Slack."""
+    from work_orchestrator.core import projects as projects_mod
+    from work_orchestrator.core import tasks as tasks_mod
+    from work_orchestrator.integrations import slack as slack_mod
+
+    config = get_config()
+    with get_db(config, readonly=True) as db:
+        if not channel:
+            proj = projects_mod.get_project(db, project)
+            channel = proj.slack_channel if proj else None
+        if not channel:
+            click.echo("No channel specified and no default channel for project.", err=True)
+            sys.exit(1)
+
+        counts = tasks_mod.status_counts(db, project)
+        blocks = slack_mod.format_status_update(project, counts)
+        try:
+            result = slack_mod.send_message(
+                config.slack_bot_token, channel, f"Status: {project}", blocks
+            )
+            click.echo(f"Status posted to {result.channel}")
+        except slack_mod.SlackError as e:
+            click.echo(f"Error: {e}", err=True)
+            sys.exit(1)
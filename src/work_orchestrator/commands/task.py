@@ -0,0 +1,279 @@
+"""Task commands (`wo task ...`)."""
+
+import json
+import sys
+from operator import attrgetter
+
+import click
+
+from work_orchestrator.commands import get_db
+from work_orchestrator.config import get_config
+
+_STATUS_ICONS = {
+    "todo": "○",
+    "in-progress": "●",
+    "done": "✓",
+    "blocked": "✗",
+}
+
+# Priority labels indexed by priority; writers clamp priority to 0-6, but
+# rows edited outside the app can hold anything
+_PRIORITY_LABELS = tuple(f"P{i}" for i in range(7))
+
+
+@click.group("task")
+def task_group():
+    """Manage tasks."""
+    pass
+
+
+@task_group.command("add")
+@click.argument("title")
+@click.option("--project", default="default", help="Project ID")
+@click.option("--description", "-d", default="", help="Task description")
+@click.option("--depends-on", default=None, help="Comma-separated task IDs this depends on")
+@click.option("--priority", "-p", default=3, type=int, help="Priority P0 (highest) to P6 (lowest)")
+def task_add(title, project, description, depends_on, priority):
+    """Create a new task."""
+    from work_orchestrator.core import projects as projects_mod
+    from work_orchestrator.core import tasks as tasks_mod
+
+    # Single pass in C; drops empty entries such as a trailing comma
+    deps = list(filter(None, map(str.strip, depends_on.split(",")))) if depends_on else None
+
+    config = get_config()
+    with get_db(config) as db:
+        # Only the default project is created on demand; any other must already exist
+        if project == "default":
+            projects_mod.ensure_default_project(db, str(config.repo_path))
+        task = tasks_mod.create_task(db, title, project, description, depends_on=deps, priority=priority)
+        click.echo(f"Created task: {task.id}")
+        click.echo(f"  Title: {task.title}")
+        click.echo(f"  Priority: P{task.priority}")
+        click.echo(f"  Status: {task.status}")
+        if task.depends_on:
+            click.echo(f"  Depends on: {', '.join(task.depends_on)}")
+
+
+@task_group.command("list")
+@click.option("--project", default="default", help="Project ID")
+@click.option("--status", default=None, help="Filter by status")
+@click.option("--json-output", "--json", is_flag=True, help="Output as JSON")
+def task_list(project, status, json_output):
+    """List tasks."""
+    from work_orchestrator.core import tasks as tasks_mod
+
+    with get_db(readonly=True) as db:
+        if json_output:
+            tasks = tasks_mod.list_tasks(db, project, status=status)
+            click.echo(json.dumps([_task_dict(t) for t in tasks], indent=2))
+            return
+
+        tasks = tasks_mod.list_tasks_with_subtasks(db, project, status=status)
+
+        if not tasks:
+            click.echo("No tasks found.")
+            return
+
+        # Build the whole listing and write it once rather than per line
+        icon_for = _STATUS_ICONS.get
+        lines = []
+        add = lines.append
+        for task in tasks:
+            status = task.status
+            dep_ids = task.depends_on
+            worktree = task.worktree_path
+            deps = f" [depends: {', '.join(dep_ids)}]" if dep_ids else ""
+            wt = f" [worktree: {worktree}]" if worktree else ""
+            add(f"  {icon_for(status, '?')} {_priority_label(task.priority)} {task.id}: {task.title} ({status}){deps}{wt}")
+
+            # Show subtasks
+            for sub in task.subtasks:
+                sub_icon = icon_for(sub.status, "?")
+                add(f"    {sub_icon} {_priority_label(sub.priority)} {sub.id}: {sub.title} ({sub.status})")
+        click.echo("\n".join(lines))
+
+
+@task_group.command("show")
+@click.argument("task_id")
+def task_show(task_id):
+    """Show task details."""
+    from work_orchestrator.core import tasks as tasks_mod
+
+    with get_db(readonly=True) as db:
+        task = tasks_mod.get_task(db, task_id, include_subtasks=False)
+        if not task:
+            click.echo(f"Task not found: {task_id}", err=True)
+            sys.exit(1)
+
+        click.echo(f"Task: {task.id}")
+        click.echo(f"  Title: {task.title}")
+        click.echo(f"  Priority: P{task.priority}")
+        click.echo(f"  Status: {task.status}")
+        click.echo(f"  Project: {task.project_id}")
+        if task.description:
+            click.echo(f"  Description: {task.description}")
+        if task.branch_name:
+            click.echo(f"  Branch: {task.branch_name}")
+        if task.worktree_path:
+            click.echo(f"  Worktree: {task.worktree_path}")
+        if task.pr_url:
+            click.echo(f"  PR: {task.pr_url}")
+        if task.depends_on:
+            click.echo(f"  Depends on: {', '.join(task.depends_on)}")
+        subtasks = tasks_mod.list_subtask_summaries(db, task_id)
+        if subtasks:
+            click.echo(f"  Subtasks:")
+            for sub_id, sub_title, sub_status in subtasks:
+                click.echo(f"    - {sub_id}: {sub_title} ({sub_status})")
+        if task.created_at:
+            click.echo(f"  Created: {task.created_at}")
+
+        events = tasks_mod.get_task_events(db, task_id)
+        if events:
+            click.echo(f"  History:")
+            click.echo("\n".join(
+                f"    [{e.created_at}] {e.event_type}: {e.old_value} -> {e.new_value}" for e in events
+            ))
+
+
+@task_group.command("start")
+@click.argument("task_id")
+def task_start(task_id):
+    """Start a task - sets status to in-progress."""
+    from work_orchestrator.core import tasks as tasks_mod
+
+    with get_db() as db:
+        task = tasks_mod.update_task_status_returning(db, task_id, "in-progress")
+        if not task:
+            click.echo(f"Task not found: {task_id}", err=True)
+            sys.exit(1)
+
+        click.echo(f"Started task: {task_id}")
+
+
+@task_group.command("done")
+@click.argument("task_id")
+@click.option("--keep-worktree", is_flag=True, help="Don't remove the worktree")
+@click.option("--notify", default=None, help="Slack channel to notify")
+def task_done(task_id, keep_worktree, notify):
+    """Mark a task as done and clean up."""
+    from work_orchestrator.core import tasks as tasks_mod
+    from work_orchestrator.core import worktrees as worktrees_mod
+    from work_orchestrator.integrations import slack as slack_mod
+
+    config = get_config()
+    with get_db(config) as db:
+        task = tasks_mod.update_task_status_returning(db, task_id, "done")
+        if not task:
+            click.echo(f"Task not found: {task_id}", err=True)
+            sys.exit(1)
+
+        click.echo(f"Completed task: {task_id}")
+
+        if not keep_worktree and task.worktree_path:
+            repo = task.project_repo_path or str(config.repo_path)
+            try:
+                worktrees_mod.remove_worktree_for_task(db, task_id, repo)
+                click.echo(f"  Worktree removed")
+            except Exception as e:
+                click.echo(f"  Worktree removal failed: {e}", err=True)
+
+        if notify:
+            try:
+                blocks = slack_mod.format_task_notification(
+                    task.id, task.title, "done", task.project_id
+                )
+                slack_mod.send_message(
+                    config.slack_bot_token,
+                    notify,
+                    f"Task completed: {task.title}",
+                    blocks,
+                )
+                click.echo(f"  Slack notification sent to {notify}")
+            except Exception as e:
+                click.echo(f"  Slack notification failed: {e}", err=True)
+
+
+@task_group.command("priority")
+@click.argument("task_id")
+@click.argument("priority", type=int)
+def task_priority(task_id, priority):
+    """Set a task's priority (P0 highest to P6 lowest)."""
+    from work_orchestrator.core import tasks as tasks_mod
+
+    if not 0 <= priority <= 6:
+        click.echo("Priority must be between 0 and 6.", err=True)
+        sys.exit(1)
+    with get_db() as db:
+        task = tasks_mod.update_task_priority(db, task_id, priority)
+        if not task:
+            click.echo(f"Task not found: {task_id}", err=True)
+            sys.exit(1)
+        click.echo(f"Updated {task_id} priority to P{task.priority}")
+
+
+@task_group.command("add-dep")
+@click.argument("task_id")
+@click.argument("depends_on_id")
+def task_add_dep(task_id, depends_on_id):
+    """Add a dependency to a task."""
+    from work_orchestrator.core import tasks as tasks_mod
+
+    with get_db() as db:
+        try:
+            task = tasks_mod.add_dependency(db, task_id, depends_on_id)
+            if not task:
+                click.echo(f"Task not found: {task_id}", err=True)
+                sys.exit(1)
+            click.echo(f"Added dependency: {task_id} now depends on {depends_on_id}")
+            click.echo(f"  Depends on: {', '.join(task.depends_on)}")
+        except ValueError as e:
+            click.echo(f"Error: {e}", err=True)
+            sys.exit(1)
+
+
+@task_group.command("remove-dep")
+@click.argument("task_id")
+@click.argument("depends_on_id")
+def task_remove_dep(task_id, depends_on_id):
+    """Remove a dependency from a task."""
+    from work_orchestrator.core import tasks as tasks_mod
+
+    with get_db() as db:
+        task = tasks_mod.remove_dependency(db, task_id, depends_on_id)
+        if not task:
+            click.echo(f"Task not found: {task_id}", err=True)
+            sys.exit(1)
+        click.echo(f"Removed dependency: {task_id} no longer depends on {depends_on_id}")
+        if task.depends_on:
+            click.echo(f"  Remaining deps: {', '.join(task.depends_on)}")
+        else:
+            click.echo(f"  No remaining dependencies")
+
+
+# ── Helpers ────────────────────────────────────────────────────────────────────
+
+
+def _priority_label(priority) -> str:
+    """Return the P<n> label, formatting priorities outside 0-6 directly."""
+    if isinstance(priority, int) and 0 <= priority < len(_PRIORITY_LABELS):
+        return _PRIORITY_LABELS[priority]
+    return f"P{priority}"
+
+
+# JSON keys and the Task attributes they are read from, in output order
+_TASK_KEYS = (
+    "id", "title", "status", "priority", "project", "description",
+    "branch", "worktree", "pr_url", "depends_on",
+)
+_task_attrs = attrgetter(
+    "id", "title", "status", "priority", "project_id", "description",
+    "branch_name", "worktree_path", "pr_url", "depends_on",
+)
+
+
+def _task_dict(task) -> dict:
+    d = dict(zip(_TASK_KEYS, _task_attrs(task)))
+    d["priority"] = _priority_label(task.priority)
+    return d
@@ -0,0 +1,20 @@
+"""Dashboard command (`wo ui`)."""
+
+import click
+
+
+@click.command("ui")
+@click.option("--host", default="127.0.0.1", help="Host to bind to")
+@click.option("--port", default=8787, type=int, help="Port to listen on")
+@click.option("--open/--no-open", default=True, help="Open browser automatically")
+def ui_command(host, port, open):
+    """Launch the web dashboard."""
+    import webbrowser
+
+    from work_orchestrator.web.app import run_server
+
+    url = f"http://{host}:{port}"
+    click.echo(f"Starting dashboard at {url}")
+    if open:
+        webbrowser.open(url)
+    run_server(host=host, port=port)
@@ -0,0 +1,51 @@
+"""Worktree commands (`wo worktree ...`)."""
+
+import click
+
+from work_orchestrator.commands import get_db
+from work_orchestrator.config import get_config
+
+
+@click.group("worktree")
+def worktree_group():
+    """Manage git worktrees."""
+    pass
+
+
+@worktree_group.command("list")
+def worktree_list():
+    """List all worktrees and their linked tasks."""
+    from work_orchestrator.core import worktrees as worktrees_mod
+
+    config = get_config()
+    with get_db(config, readonly=True) as db:
+        wts = worktrees_mod.list_task_worktrees(db, str(config.repo_path))
+        if not wts:
+            click.echo("No worktrees found.")
+            return
+        lines = []
+        for wt in wts:
+            task_info = ""
+            if "task_id" in wt:
+                task_info = f" -> {wt['task_id']}: {wt.get('task_title', '')} ({wt.get('task_status', '')})"
+            lines.append(f"  {wt['branch']} at {wt['path']}{task_info}")
+        click.echo("\n".join(lines))
+
+
+@worktree_group.command("clean")
+@click.option("--project", default="default", help="Project ID")
+def worktree_clean(project):
+    """Remove worktrees for all completed tasks."""
+    from work_orchestrator.core import worktrees as worktrees_mod
+
+    config = get_config()
+    with get_db(config) as db:
+        results = worktrees_mod.cleanup_done_worktrees(db, str(config.repo_path), project)
+        if not results:
+            click.echo("No worktrees to clean up.")
+            return
+        for r in results:
+            if r.get("removed"):
+                click.echo(f"  Removed: {r.get('path', r['task_id'])}")
+            else:
+                click.echo(f"  Skipped {r['task_id']}: {r.get('reason', 'unknown')}")
@@ -2,8 +2,23 @@
 
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
+# Everything Config.from_env() depends on; HOME backs the default db_path
+_ENV_VARS = (
+    "WO_DB_PATH",
+    "WO_REPO_PATH",
+    "SLACK_BOT_TOKEN",
+    "WO_WORKTREE_DIR",
+    "WO_AGENT_OUTPUT_DIR",
+    "WO_AGENT_DEFAULT_MODEL",
+    "WO_AGENT_DEFAULT_BUDGET",
+    "WO_AGENT_DEFAULT_MAX_TURNS",
+    "WO_DEFAULT_BACKEND",
+    "HOME",
+)
+
 
 @dataclass
 class Config:
@@ -19,13 +34,16 @@ class Config:
 
     @classmethod
     def from_env(cls) -> "Config":
-        config = cls()
-
+        # Pass the paths in up front so the Path.home() / Path.cwd() default
+        # factories only run when the environment doesn't set them
+        paths = {}
         if db := os.environ.get("WO_DB_PATH"):
-            config.db_path = Path(db)
+            paths["db_path"] = Path(db)
 
         if repo := os.environ.get("WO_REPO_PATH"):
-            config.repo_path = Path(repo)
+            paths["repo_path"] = Path(repo)
+
+        config = cls(**paths)
 
         config.slack_bot_token = os.environ.get("SLACK_BOT_TOKEN")
 
@@ -51,4 +69,17 @@ class Config:
 
 
 def get_config() -> Config:
+    """Return the config for the current environment.
+
+    The environment is only parsed again when one of the variables it reads
+    (or the working directory, the repo_path default) has changed. Callers
+    share the returned instance and must not modify it.
+    """
+    env = tuple(map(os.environ.get, _ENV_VARS))
+    # The working directory only matters when WO_REPO_PATH doesn't override it
+    return _config_for(env, None if env[1] else os.getcwd())
+
+
+@lru_cache(maxsize=8)
+def _config_for(env: tuple, cwd: str | None) -> Config:
     return Config.from_env()
@@ -3,6 +3,8 @@
 import json
 import logging
 import os
+import queue
+import select
 import shlex
 import signal
 import sqlite3
@@ -12,10 +14,15 @@ import time
 from datetime import datetime
 from pathlib import Path
 
-from work_orchestrator.core.tasks import _log_event, get_task, update_task_status
+from work_orchestrator.core.tasks import (
+    _log_event,
+    get_task,
+    get_task_with_project,
+    update_task_status_returning,
+)
 from work_orchestrator.core.projects import get_project
 from work_orchestrator.core.memory import search_memories
-from work_orchestrator.db.models import AgentRun, WorktreeSlot
+from work_orchestrator.db.models import AgentRun, Project, Task, WorktreeSlot
 from work_orchestrator.integrations.git import worktree_list
 
 logger = logging.getLogger(__name__)
@@ -23,6 +30,26 @@ logger = logging.getLogger(__name__)
 # Module-level registry of active Popen objects (keyed by PID)
 _active_processes: dict[int, subprocess.Popen] = {}
 
+# PIDs of child agents that have exited, fed by one reaper thread per Popen so
+# the monitor hears about exits as they happen instead of on its next scan
+_exited_pids: queue.Queue[int | None] = queue.Queue()
+
+
+def _reap_process(proc: subprocess.Popen):
+    """Block until an agent process exits, then notify the monitor."""
+    proc.wait()
+    _exited_pids.put(proc.pid)
+
+
+def _log_notify_failure(future):
+    """Log a background Slack notification that failed."""
+    exc = future.exception()
+    if exc is not None:
+        logger.error(
+            "Failed to send Slack notification for agent completion",
+            exc_info=(type(exc), exc, exc.__traceback__),
+        )
+
 
 # ── Row-to-model helpers ────────────────────────────────────────────────────
 
@@ -80,17 +107,21 @@ def register_worktree_slot(
     path: str,
     label: str,
     branch: str | None = None,
+    commit: bool = True,
 ) -> WorktreeSlot:
-    """Register a single worktree as an available slot."""
-    db.execute(
+    """Register a single worktree as an available slot.
+
+    The path is stored resolved, so lookups can compare paths as plain strings.
+    """
+    path = str(Path(path).resolve())
+    row = db.execute(
         """INSERT INTO worktree_slots (project_id, path, label, branch)
-           VALUES (?, ?, ?, ?)""",
+           VALUES (?, ?, ?, ?)
+           RETURNING *""",
         (project_id, path, label, branch),
-    )
-    db.commit()
-    row = db.execute(
-        "SELECT * FROM worktree_slots WHERE path = ?", (path,)
     ).fetchone()
+    if commit:
+        db.commit()
     return _row_to_slot(row)
 
 
@@ -109,7 +140,8 @@ def discover_and_register_worktrees(
 
     git_worktrees = worktree_list(repo_path)
 
-    # Find already-registered paths
+    # Find already-registered paths; rows from older versions may be stored
+    # unresolved, so resolve them before comparing
     existing = db.execute(
         "SELECT path FROM worktree_slots WHERE project_id = ?", (project_id,)
     ).fetchall()
@@ -124,9 +156,13 @@ def discover_and_register_worktrees(
             continue
 
         label = Path(wt.path).name or project_id
-        slot = register_worktree_slot(db, project_id, resolved, label, wt.branch)
+        slot = register_worktree_slot(
+            db, project_id, resolved, label, wt.branch, commit=False
+        )
         registered.append(slot)
 
+    # One commit for the whole batch rather than one per worktree
+    db.commit()
     return registered
 
 
@@ -182,16 +218,17 @@ def assign_task_to_slot(
         raise ValueError(
             f"Slot '{slot.label}' is already occupied by task {slot.current_task_id}"
         )
-    task = get_task(db, task_id)
-    if not task:
+    # Existence check only; get_task would also load dependencies and subtasks
+    if not db.execute("SELECT 1 FROM tasks WHERE id = ?", (task_id,)).fetchone():
         raise ValueError(f"Task not found: {task_id}")
 
-    db.execute(
+    row = db.execute(
         """UPDATE worktree_slots
            SET status = 'occupied', current_task_id = ?, updated_at = datetime('now')
-           WHERE id = ?""",
+           WHERE id = ?
+           RETURNING *""",
         (task_id, slot_id),
-    )
+    ).fetchone()
     db.execute(
         """UPDATE tasks
            SET worktree_path = ?, branch_name = ?, updated_at = datetime('now')
@@ -200,7 +237,7 @@ def assign_task_to_slot(
     )
     _log_event(db, task_id, "assigned_to_slot", None, slot.label)
     db.commit()
-    return get_worktree_slot(db, slot_id)
+    return _row_to_slot(row)
 
 
 def release_slot(
@@ -242,14 +279,15 @@ def release_slot(
         except Exception:
             logger.warning("Failed to recycle worktree for slot %s", slot_id)
 
-    db.execute(
+    row = db.execute(
         """UPDATE worktree_slots
            SET status = 'available', current_task_id = NULL, updated_at = datetime('now')
-           WHERE id = ?""",
+           WHERE id = ?
+           RETURNING *""",
         (slot_id,),
-    )
+    ).fetchone()
     db.commit()
-    return get_worktree_slot(db, slot_id)
+    return _row_to_slot(row)
 
 
 # ── One-Step Delegation ─────────────────────────────────────────────────────
@@ -343,6 +381,7 @@ def delegate_task(
         mcp_config_path=mcp_config_path,
         terminal=terminal,
         backend=backend,
+        project=project,
     )
 
 
@@ -353,13 +392,21 @@ def build_agent_prompt(
     db: sqlite3.Connection,
     task_id: str,
     instructions: str,
+    task: Task | None = None,
+    project: Project | None = None,
 ) -> str:
-    """Build a rich prompt for the sub-agent including task context."""
-    task = get_task(db, task_id)
-    if not task:
-        raise ValueError(f"Task not found: {task_id}")
+    """Build a rich prompt for the sub-agent including task context.
 
-    project = get_project(db, task.project_id)
+    Callers that already hold the task or its project can pass them in to
+    skip the lookups.
+    """
+    if task is None:
+        task = get_task(db, task_id)
+        if not task:
+            raise ValueError(f"Task not found: {task_id}")
+
+    if project is None or project.id != task.project_id:
+        project = get_project(db, task.project_id)
 
     parts = []
     parts.append(f"# Task: {task.title}")
@@ -388,10 +435,17 @@ def build_agent_prompt(
 
     if task.depends_on:
         parts.append(f"\n## Dependencies")
+        deps = {
+            r["id"]: r
+            for r in db.execute(
+                "SELECT id, title, status FROM tasks WHERE id IN (SELECT value FROM json_each(?))",
+                (json.dumps(task.depends_on),),
+            )
+        }
         for dep_id in task.depends_on:
-            dep = get_task(db, dep_id)
+            dep = deps.get(dep_id)
             if dep:
-                parts.append(f"- {dep.title} ({dep.id}): {dep.status}")
+                parts.append(f"- {dep['title']} ({dep['id']}): {dep['status']}")
 
     # Show concurrent agents working on the same project
     try:
@@ -417,10 +471,10 @@ def build_agent_prompt(
 
     # Pull relevant memories (best-effort)
     try:
-        memories = search_memories(db, task.title, project_id=task.project_id)
+        memories = search_memories(db, task.title, project_id=task.project_id, limit=5)
         if memories:
             parts.append(f"\n## Relevant Context (from memory)")
-            for mem in memories[:5]:
+            for mem in memories:
                 parts.append(f"- **{mem.key}**: {mem.value}")
     except Exception:
         pass
@@ -466,12 +520,14 @@ def launch_agent(
     mcp_config_path: str | None = None,
     terminal: bool = True,
     backend: str | None = None,
+    project: Project | None = None,
 ) -> AgentRun:
     """Launch an agent sub-process for a task using the specified backend.
 
     The task must be assigned to a worktree slot.
     If terminal=True (default), opens the agent in a new Terminal window so you can watch it.
-    Backend defaults to "claude-code" if not specified.
+    Backend defaults to "claude-code" if not specified. A project already
+    loaded by the caller is reused for the prompt.
     """
     from work_orchestrator.backends import get_backend
 
@@ -505,7 +561,7 @@ def launch_agent(
     agent_backend = get_backend(backend_name)
 
     # Build the prompt
-    prompt = build_agent_prompt(db, task_id, instructions)
+    prompt = build_agent_prompt(db, task_id, instructions, task=task, project=project)
 
     # Prepare output file (use absolute paths so they work after cd to worktree)
     out_path = Path(output_dir).resolve()
@@ -531,6 +587,7 @@ def launch_agent(
         )
     else:
         # Background mode: build command list via backend
+        prompt_file = out_path / f"agent-{task_id}-{timestamp}.prompt.md"
         cmd = agent_backend.build_command(
             prompt=prompt,
             model=model,
@@ -539,36 +596,46 @@ def launch_agent(
             permission_mode=permission_mode,
             output_format="json",
             mcp_config_path=mcp_config_path,
+            prompt_file=str(prompt_file),
         )
 
-        with open(output_file, "w") as f:
+        # The backend writes the prompt file only if it reads the prompt from
+        # stdin; otherwise the agent gets no stdin rather than ours
+        with open(output_file, "w") as f, (
+            open(prompt_file) if prompt_file.exists() else open(os.devnull)
+        ) as stdin:
+            # Own session (and process group), so cancel_agent can signal the
+            # agent together with the tool subprocesses it spawns
             proc = subprocess.Popen(
                 cmd,
                 cwd=slot.path,
+                stdin=stdin,
                 stdout=f,
                 stderr=subprocess.STDOUT,
+                start_new_session=True,
             )
         _active_processes[proc.pid] = proc
+        threading.Thread(
+            target=_reap_process,
+            args=(proc,),
+            name=f"agent-reaper-{proc.pid}",
+            daemon=True,
+        ).start()
         pid = proc.pid
 
-    # Update task status
+    # Update task status and record the agent run in one transaction
     if task.status == "todo":
-        update_task_status(db, task_id, "in-progress")
+        update_task_status_returning(db, task_id, "in-progress", commit=False)
 
-    # Record the agent run
-    db.execute(
+    run_row = db.execute(
         """INSERT INTO agent_runs
            (task_id, worktree_slot_id, pid, status, instructions, model, max_budget, backend, output_file)
-           VALUES (?, ?, ?, 'running', ?, ?, ?, ?, ?)""",
+           VALUES (?, ?, ?, 'running', ?, ?, ?, ?, ?)
+           RETURNING *""",
         (task_id, slot.id, pid, instructions, model, max_budget, backend_name, output_file),
-    )
+    ).fetchone()
     _log_event(db, task_id, "agent_launched", None, f"PID {pid} ({backend_name})")
     db.commit()
-
-    run_row = db.execute(
-        "SELECT * FROM agent_runs WHERE pid = ? AND status = 'running'",
-        (pid,),
-    ).fetchone()
     return _row_to_agent_run(run_row)
 
 
@@ -592,7 +659,9 @@ def _launch_in_terminal(
     script = (
         "#!/bin/bash\n"
         f"cd {shlex.quote(cwd)}\n"
-        f"echo $$ > {shlex.quote(pid_file)}\n"
+        # Best effort: if we stopped listening, a closed FIFO must not kill
+        # the launcher with SIGPIPE ($$ is still the script's PID in here)
+        f"( trap '' PIPE; echo $$ > {shlex.quote(pid_file)} ) 2>/dev/null\n"
         f"echo '=== Agent started for task: {task_id} ==='\n"
         f"echo '=== Working in: {cwd} ==='\n"
         f"echo ''\n"
@@ -614,18 +683,29 @@ def _launch_in_terminal(
         f'    do script {shlex.quote(script_file)}\n'
         "end tell\n"
     )
-    subprocess.Popen(["osascript", "-e", applescript])
-
-    # Wait for the PID file to appear (the script writes it on startup)
-    for _ in range(50):
-        if Path(pid_file).exists():
+    # The script reports its PID through a FIFO, so we wake the moment it
+    # writes instead of polling for a file. Holding our own write end keeps the
+    # read end from seeing EOF before the script opens it.
+    os.mkfifo(pid_file)
+    read_fd = os.open(pid_file, os.O_RDONLY | os.O_NONBLOCK)
+    write_fd = os.open(pid_file, os.O_WRONLY | os.O_NONBLOCK)
+    try:
+        subprocess.Popen(["osascript", "-e", applescript])
+        ready, _, _ = select.select([read_fd], [], [], 5)
+        if ready:
             try:
-                return int(Path(pid_file).read_text().strip())
-            except (ValueError, OSError):
+                return int(os.read(read_fd, 64).decode().strip())
+            except ValueError:
                 pass
-        time.sleep(0.1)
-
-    # Fallback: return 0 if PID file never appeared
+    finally:
+        # Unlink before closing: a launcher that gets to its echo after we
+        # give up then writes a plain file instead of blocking forever in
+        # open() on a FIFO that has no reader
+        Path(pid_file).unlink(missing_ok=True)
+        os.close(read_fd)
+        os.close(write_fd)
+
+    # Fallback: return 0 if the script never reported its PID
     logger.warning("Could not read PID file for terminal agent %s", task_id)
     return 0
 
@@ -709,7 +789,13 @@ def cancel_agent(db: sqlite3.Connection, task_id: str) -> AgentRun | None:
     run = _row_to_agent_run(row)
     if run.pid:
         try:
-            os.kill(run.pid, signal.SIGTERM)
+            # Background agents lead their own process group, as does the
+            # terminal launcher script under the shell's job control; only
+            # signal the group when the agent leads it
+            if os.getpgid(run.pid) == run.pid:
+                os.killpg(run.pid, signal.SIGTERM)
+            else:
+                os.kill(run.pid, signal.SIGTERM)
         except ProcessLookupError:
             pass  # Already exited
         _active_processes.pop(run.pid, None)
@@ -747,11 +833,24 @@ class AgentMonitor:
         self.slack_token = slack_token
         self._stop_event = threading.Event()
         self._thread: threading.Thread | None = None
+        # Connections reused across polls: status polls read through a
+        # read-only connection so they never contend with writers, and only
+        # completions use the read-write one. The lock serializes the monitor
+        # thread with start()/stop() on the caller's thread.
+        self._db: sqlite3.Connection | None = None
+        self._reader: sqlite3.Connection | None = None
+        self._db_lock = threading.Lock()
 
     def start(self):
         """Start the monitor thread."""
+        from work_orchestrator.db.engine import connect_readonly, init_db
+
         if self._thread and self._thread.is_alive():
             return
+        with self._db_lock:
+            if self._db is None:
+                self._db = init_db(self.db_path, check_same_thread=False)
+                self._reader = connect_readonly(self.db_path)
         self._stop_event.clear()
         self._thread = threading.Thread(
             target=self._run, name="agent-monitor", daemon=True
@@ -762,26 +861,47 @@ class AgentMonitor:
     def stop(self):
         """Signal the monitor thread to stop."""
         self._stop_event.set()
+        _exited_pids.put(None)  # Wake the monitor if it is waiting for an exit
         if self._thread:
             self._thread.join(timeout=10)
+        with self._db_lock:
+            if self._db is not None:
+                self._reader.close()
+                self._db.close()
+                self._db = self._reader = None
         logger.info("Agent monitor stopped")
 
     def _run(self):
-        """Main monitor loop."""
+        """Main monitor loop.
+
+        Exits of our own child agents arrive through the reaper queue and are
+        handled immediately. A full scan runs at startup and once every
+        poll_interval, however many exits arrive in between, to pick up
+        terminal-mode and orphaned runs, which have no Popen to wait on.
+        """
+        pid, last_scan = None, None
         while not self._stop_event.is_set():
             try:
-                self._check_agents()
+                if pid is not None:  # None is the wake-up sent by stop()
+                    self._reap(pid)
+                if last_scan is None or time.monotonic() - last_scan >= self.poll_interval:
+                    last_scan = time.monotonic()
+                    self._check_agents()
             except Exception:
                 logger.exception("Error in agent monitor loop")
-            self._stop_event.wait(self.poll_interval)
+            wait = max(0.0, self.poll_interval - (time.monotonic() - last_scan))
+            try:
+                pid = _exited_pids.get(timeout=wait)
+            except queue.Empty:
+                pid = None
 
     def _check_agents(self):
         """Check all running agents and handle completions."""
-        from work_orchestrator.db.engine import init_db
-
-        db = init_db(self.db_path)
-        try:
-            rows = db.execute(
+        with self._db_lock:
+            db = self._db
+            if db is None:
+                return
+            rows = self._reader.execute(
                 "SELECT * FROM agent_runs WHERE status = 'running'"
             ).fetchall()
             for row in rows:
@@ -797,8 +917,22 @@ class AgentMonitor:
                     # Orphaned run (server restarted) — check if PID alive
                     if not self._is_pid_alive(run.pid):
                         self._handle_completion(db, run, exit_code=None)
-        finally:
-            db.close()
+
+    def _reap(self, pid: int):
+        """Handle completion of a child agent whose reaper saw it exit."""
+        with self._db_lock:
+            proc = _active_processes.get(pid)
+            if self._db is None or proc is None:
+                return  # Monitor stopped, or already handled by a scan or cancel
+            row = self._reader.execute(
+                "SELECT * FROM agent_runs WHERE pid = ? AND status = 'running' "
+                "ORDER BY id DESC LIMIT 1",
+                (pid,),
+            ).fetchone()
+            if not row:
+                return  # Run not recorded yet; the next scan will handle it
+            _active_processes.pop(pid, None)
+            self._handle_completion(self._db, _row_to_agent_run(row), proc.poll())
 
     def _is_pid_alive(self, pid: int | None) -> bool:
         """Check if a process is still running."""
@@ -860,20 +994,27 @@ class AgentMonitor:
         if exit_code and exit_code != 0:
             status = "failed"
 
-        db.execute(
+        # Only a run still marked running is ours to finish; cancel_agent may
+        # have claimed it since it was read
+        cur = db.execute(
             """UPDATE agent_runs
                SET status = ?, exit_code = ?, result_summary = ?,
                    completed_at = datetime('now')
-               WHERE id = ?""",
+               WHERE id = ? AND status = 'running'""",
             (status, exit_code, result_summary, run.id),
         )
+        if not cur.rowcount:
+            return
 
-        # Move task to 'review' (not auto-done — user reviews first)
+        # Move task to 'review' (not auto-done — user reviews first). The run,
+        # status and event rows commit together, before PR creation and slot
+        # recycling shell out to gh/git with the write lock released.
         if status == "completed":
-            update_task_status(db, run.task_id, "review")
+            update_task_status_returning(db, run.task_id, "review", commit=False)
             _log_event(db, run.task_id, "agent_completed", None, result_summary)
         else:
             _log_event(db, run.task_id, "agent_failed", None, result_summary)
+        db.commit()
 
         # Auto-create PR if agent succeeded and branch has commits
         pr_url = None
@@ -887,8 +1028,6 @@ class AgentMonitor:
             base = project_for_base.default_branch if project_for_base else "main"
             release_slot(db, run.worktree_slot_id, recycle=True, base_branch=base)
 
-        db.commit()
-
         # Publish event for real-time UI updates
         from work_orchestrator.core.events import publish
 
@@ -947,6 +1086,7 @@ class AgentMonitor:
                 (pr_url, task.id),
             )
             _log_event(db, task.id, "pr_created", None, pr_url)
+            db.commit()
             logger.info("Auto-created PR for task %s: %s", task.id, pr_url)
 
         return pr_url
@@ -962,13 +1102,12 @@ class AgentMonitor:
         if not self.slack_token:
             return
         try:
-            from work_orchestrator.integrations.slack import send_message
+            from work_orchestrator.integrations.slack import send_message_async
 
-            task = get_task(db, run.task_id)
+            task = get_task_with_project(db, run.task_id)
             if not task:
                 return
-            project = get_project(db, task.project_id)
-            channel = project.slack_channel if project else None
+            channel = task.project_slack_channel
             if not channel:
                 return
 
@@ -980,6 +1119,9 @@ class AgentMonitor:
             if summary:
                 text += f"Summary: {summary[:200]}"
 
-            send_message(self.slack_token, channel, text)
+            # Post in the background so the monitor is not held up by the
+            # Slack round trip while other agents finish
+            future = send_message_async(self.slack_token, channel, text)
+            future.add_done_callback(_log_notify_failure)
         except Exception:
             logger.exception("Failed to send Slack notification for agent completion")
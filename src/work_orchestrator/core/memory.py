@@ -14,25 +14,18 @@ def remember(
     project_id: str | None = None,
 ) -> Memory:
     """Store or update a memory entry."""
-    existing = db.execute(
-        "SELECT id FROM memories WHERE key = ? AND (project_id = ? OR (project_id IS NULL AND ? IS NULL))",
-        (key, project_id, project_id),
+    # The conflict target matches idx_memories_key_scope, which also covers
+    # global (NULL project) memories that UNIQUE(key, project_id) lets through
+    row = db.execute(
+        """INSERT INTO memories (key, value, category, project_id) VALUES (?, ?, ?, ?)
+           ON CONFLICT(key, COALESCE(project_id, '')) DO UPDATE
+           SET value = excluded.value, category = excluded.category,
+               updated_at = datetime('now')
+           RETURNING *""",
+        (key, value, category, project_id),
     ).fetchone()
-
-    if existing:
-        db.execute(
-            "UPDATE memories SET value = ?, category = ?, updated_at = datetime('now') WHERE id = ?",
-            (value, category, existing["id"]),
-        )
-        db.commit()
-        return recall_by_key(db, key, project_id)
-    else:
-        db.execute(
-            "INSERT INTO memories (key, value, category, project_id) VALUES (?, ?, ?, ?)",
-            (key, value, category, project_id),
-        )
-        db.commit()
-        return recall_by_key(db, key, project_id)
+    db.commit()
+    return _row_to_memory(row)
 
 
 def recall_by_key(
@@ -55,8 +48,12 @@ def search_memories(
     query: str,
     category: str | None = None,
     project_id: str | None = None,
+    limit: int | None = None,
 ) -> list[Memory]:
-    """Full-text search across memories."""
+    """Full-text search across memories, best match first.
+
+    With project_id, matches that project's memories and global ones.
+    """
     sql = """
         SELECT m.* FROM memories m
         JOIN memories_fts fts ON m.id = fts.rowid
@@ -69,10 +66,13 @@ def search_memories(
         params.append(category)
 
     if project_id is not None:
-        sql += " AND m.project_id = ?"
+        sql += " AND (m.project_id = ? OR m.project_id IS NULL)"
         params.append(project_id)
 
     sql += " ORDER BY rank"
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
     rows = db.execute(sql, params).fetchall()
     return [_row_to_memory(r) for r in rows]
 
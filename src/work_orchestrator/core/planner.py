@@ -207,10 +207,12 @@ def _build_brainstorm_system(
 
         # Pull relevant memories
         try:
-            memories = search_memories(db, "architecture design plan", project_id=project_id)
+            memories = search_memories(
+                db, "architecture design plan", project_id=project_id, limit=5
+            )
             if memories:
                 parts.append("## Project Context (from memory)")
-                for mem in memories[:5]:
+                for mem in memories:
                     parts.append(f"- **{mem.key}**: {mem.value}")
                 parts.append("")
         except Exception:
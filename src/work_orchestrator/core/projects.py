@@ -2,6 +2,7 @@
 
 import sqlite3
 from datetime import datetime
+from pathlib import Path
 
 from work_orchestrator.db.models import Project
 
@@ -10,18 +11,19 @@ def create_project(
     db: sqlite3.Connection,
     project_id: str,
     name: str,
-    repo_path: str,
+    repo_path: str | Path,
     default_branch: str = "main",
     slack_channel: str | None = None,
 ) -> Project:
     """Create a new project."""
-    db.execute(
+    row = db.execute(
         """INSERT INTO projects (id, name, repo_path, default_branch, slack_channel)
-           VALUES (?, ?, ?, ?, ?)""",
-        (project_id, name, repo_path, default_branch, slack_channel),
-    )
+           VALUES (?, ?, ?, ?, ?)
+           RETURNING *""",
+        (project_id, name, str(repo_path), default_branch, slack_channel),
+    ).fetchone()
     db.commit()
-    return get_project(db, project_id)
+    return _row_to_project(row)
 
 
 def get_project(db: sqlite3.Connection, project_id: str) -> Project | None:
@@ -51,12 +53,12 @@ def update_project(
 
     set_clause = ", ".join(f"{k} = ?" for k in updates)
     values = list(updates.values()) + [project_id]
-    db.execute(
-        f"UPDATE projects SET {set_clause}, updated_at = datetime('now') WHERE id = ?",
+    row = db.execute(
+        f"UPDATE projects SET {set_clause}, updated_at = datetime('now') WHERE id = ? RETURNING *",
         values,
-    )
+    ).fetchone()
     db.commit()
-    return get_project(db, project_id)
+    return _row_to_project(row) if row else None
 
 
 def ensure_default_project(db: sqlite3.Connection, repo_path: str) -> Project:
@@ -1,38 +1,40 @@
 """Task management operations."""
 
+import json
 import re
 import sqlite3
 from datetime import datetime
 
 from work_orchestrator.db.models import Task, TaskEvent
 
+_SLUG_DROP_RE = re.compile(r"[^\w\s-]")
+# Runs of whitespace, underscores and hyphens all collapse to one hyphen
+_SLUG_SEP_RE = re.compile(r"[\s_-]+")
+
 
 def slugify(title: str) -> str:
     """Convert a title to a URL-friendly slug."""
-    slug = title.lower().strip()
-    slug = re.sub(r"[^\w\s-]", "", slug)
-    slug = re.sub(r"[\s_]+", "-", slug)
-    slug = re.sub(r"-+", "-", slug)
+    slug = _SLUG_DROP_RE.sub("", title.lower().strip())
+    slug = _SLUG_SEP_RE.sub("-", slug)
     return slug.strip("-")[:60]
 
 
 def _unique_id(db: sqlite3.Connection, base_slug: str) -> str:
     """Generate a unique task ID from a slug, appending a number if needed."""
-    existing = db.execute(
-        "SELECT id FROM tasks WHERE id = ?", (base_slug,)
-    ).fetchone()
-    if not existing:
+    # One query for the slug and all its numbered variants; slugs hold only
+    # word characters and hyphens, so they are safe inside a GLOB pattern
+    rows = db.execute(
+        "SELECT id FROM tasks WHERE id = ? OR id GLOB ?",
+        (base_slug, f"{base_slug}-[0-9]*"),
+    ).fetchall()
+    taken = {r["id"] for r in rows}
+    if base_slug not in taken:
         return base_slug
 
     i = 2
-    while True:
-        candidate = f"{base_slug}-{i}"
-        existing = db.execute(
-            "SELECT id FROM tasks WHERE id = ?", (candidate,)
-        ).fetchone()
-        if not existing:
-            return candidate
+    while f"{base_slug}-{i}" in taken:
         i += 1
+    return f"{base_slug}-{i}"
 
 
 def create_task(
@@ -44,50 +46,106 @@ def create_task(
     depends_on: list[str] | None = None,
     pr_url: str | None = None,
     priority: int = 3,
+    commit: bool = True,
 ) -> Task:
-    """Create a new task."""
+    """Create a new task.
+
+    Pass commit=False to leave the write in the caller's transaction.
+    """
     task_id = _unique_id(db, slugify(title))
     priority = max(0, min(6, priority))
 
-    db.execute(
+    row = db.execute(
         """INSERT INTO tasks (id, project_id, title, description, parent_task_id, pr_url, priority)
-           VALUES (?, ?, ?, ?, ?, ?, ?)""",
+           VALUES (?, ?, ?, ?, ?, ?, ?)
+           RETURNING *""",
         (task_id, project_id, title, description, parent_task_id, pr_url, priority),
-    )
+    ).fetchone()
 
     if depends_on:
-        for dep_id in depends_on:
-            db.execute(
-                "INSERT INTO task_dependencies (task_id, depends_on_task_id) VALUES (?, ?)",
-                (task_id, dep_id),
-            )
+        db.executemany(
+            "INSERT INTO task_dependencies (task_id, depends_on_task_id) VALUES (?, ?)",
+            [(task_id, dep_id) for dep_id in depends_on],
+        )
 
     _log_event(db, task_id, "created", None, "todo")
-    db.commit()
-    return get_task(db, task_id)
+    if commit:
+        db.commit()
+    # A new task has no subtasks, and its dependencies are exactly depends_on
+    task = _row_to_task(row)
+    task.depends_on = list(depends_on or [])
+    return task
 
 
-def get_task(db: sqlite3.Connection, task_id: str) -> Task | None:
-    """Get a task by ID with its dependencies."""
-    row = db.execute("SELECT * FROM tasks WHERE id = ?", (task_id,)).fetchone()
-    if not row:
+def get_task(
+    db: sqlite3.Connection,
+    task_id: str,
+    include_subtasks: bool = True,
+) -> Task | None:
+    """Get a task by ID with its dependencies (and subtasks, unless excluded)."""
+    # One statement: the task row carries its dependencies as a JSON array,
+    # and its subtasks' rows follow it in subtask order
+    query = """SELECT t.*, 0 AS is_subtask,
+                      (SELECT json_group_array(depends_on_task_id) FROM task_dependencies
+                       WHERE task_id = t.id) AS depends_on_json
+               FROM tasks t WHERE t.id = ?"""
+    params = [task_id]
+    if include_subtasks:
+        query += """
+               UNION ALL
+               SELECT s.*, 1, NULL FROM tasks s WHERE s.parent_task_id = ?
+               ORDER BY is_subtask, priority, created_at"""
+        params.append(task_id)
+    rows = db.execute(query, params).fetchall()
+    if not rows or rows[0]["is_subtask"]:
         return None
 
-    task = _row_to_task(row)
+    task = _row_to_task(rows[0])
+    task.depends_on = json.loads(rows[0]["depends_on_json"])
+    task.subtasks = [_row_to_task(r) for r in rows[1:]]
+    return task
 
+
+def _load_relations(db: sqlite3.Connection, task: Task, include_subtasks: bool = True) -> Task:
+    """Fill a task's dependencies and, unless excluded, its subtasks."""
     deps = db.execute(
         "SELECT depends_on_task_id FROM task_dependencies WHERE task_id = ?",
-        (task_id,),
+        (task.id,),
     ).fetchall()
     task.depends_on = [d["depends_on_task_id"] for d in deps]
 
-    subtasks = db.execute(
-        "SELECT * FROM tasks WHERE parent_task_id = ? ORDER BY priority ASC, created_at ASC",
+    if include_subtasks:
+        subtasks = db.execute(
+            "SELECT * FROM tasks WHERE parent_task_id = ? ORDER BY priority ASC, created_at ASC",
+            (task.id,),
+        ).fetchall()
+        task.subtasks = [_row_to_task(s) for s in subtasks]
+
+    return task
+
+
+def list_subtask_summaries(db: sqlite3.Connection, task_id: str) -> list[tuple[str, str, str]]:
+    """Return (id, title, status) for each subtask of a task, in subtask order."""
+    rows = db.execute(
+        "SELECT id, title, status FROM tasks WHERE parent_task_id = ? ORDER BY priority ASC, created_at ASC",
         (task_id,),
     ).fetchall()
-    task.subtasks = [_row_to_task(s) for s in subtasks]
+    return [tuple(r) for r in rows]
 
-    return task
+
+def get_task_with_project(db: sqlite3.Connection, task_id: str) -> Task | None:
+    """Get a task by ID along with its project's repo path and Slack channel.
+
+    Dependencies and subtasks are not loaded.
+    """
+    row = db.execute(
+        """SELECT t.*, p.repo_path AS project_repo_path,
+                  p.slack_channel AS project_slack_channel
+           FROM tasks t LEFT JOIN projects p ON p.id = t.project_id
+           WHERE t.id = ?""",
+        (task_id,),
+    ).fetchone()
+    return _row_to_task(row) if row else None
 
 
 def list_tasks(
@@ -111,46 +169,157 @@ def list_tasks(
         query += " AND parent_task_id IS NULL"
 
     query += " ORDER BY priority ASC, created_at ASC"
-    rows = db.execute(query, params).fetchall()
+    tasks = [_row_to_task(r) for r in db.execute(query, params)]
+    _load_dependencies(db, tasks)
+    return tasks
+
+
+def list_tasks_with_subtasks(
+    db: sqlite3.Connection,
+    project_id: str = "default",
+    status: str | None = None,
+) -> list[Task]:
+    """List top-level tasks with their subtasks attached, in a single query.
+
+    The status filter applies to top-level tasks only; all subtasks of a
+    matching parent are included. Subtasks do not have depends_on loaded.
+    """
+    query = """
+        SELECT t.* FROM tasks t
+        JOIN tasks p ON p.id = COALESCE(t.parent_task_id, t.id)
+        WHERE p.project_id = ? AND p.parent_task_id IS NULL AND t.project_id = ?
+    """
+    params: list = [project_id, project_id]
+    if status:
+        query += " AND p.status = ?"
+        params.append(status)
+    # Parents in list_tasks order, each immediately followed by its subtasks
+    query += """
+        ORDER BY p.priority ASC, p.created_at ASC, p.rowid,
+                 t.parent_task_id IS NOT NULL, t.priority ASC, t.created_at ASC
+    """
     tasks = []
-    for row in rows:
+    for row in db.execute(query, params):
         task = _row_to_task(row)
-        deps = db.execute(
-            "SELECT depends_on_task_id FROM task_dependencies WHERE task_id = ?",
-            (task.id,),
-        ).fetchall()
-        task.depends_on = [d["depends_on_task_id"] for d in deps]
-        tasks.append(task)
+        if task.parent_task_id is None:
+            tasks.append(task)
+        else:
+            tasks[-1].subtasks.append(task)
+
+    _load_dependencies(db, tasks)
     return tasks
 
 
+def list_subtasks_by_parents(
+    db: sqlite3.Connection,
+    project_id: str,
+    parent_ids: list[str],
+) -> dict[str, list[Task]]:
+    """Fetch the subtasks of several parents in one query, keyed by parent ID.
+
+    Parents without subtasks are absent from the result.
+    """
+    if not parent_ids:
+        return {}
+    rows = db.execute(
+        """SELECT * FROM tasks
+           WHERE project_id = ? AND parent_task_id IN (SELECT value FROM json_each(?))
+           ORDER BY priority ASC, created_at ASC""",
+        (project_id, json.dumps(parent_ids)),
+    ).fetchall()
+    subtasks = [_row_to_task(row) for row in rows]
+    _load_dependencies(db, subtasks)
+
+    by_parent: dict[str, list[Task]] = {}
+    for sub in subtasks:
+        by_parent.setdefault(sub.parent_task_id, []).append(sub)
+    return by_parent
+
+
+def status_counts(db: sqlite3.Connection, project_id: str = "default") -> dict[str, int]:
+    """Count a project's top-level tasks (the ones list_tasks returns) by status."""
+    return dict(db.execute(
+        """SELECT status, COUNT(*) FROM tasks
+           WHERE project_id = ? AND parent_task_id IS NULL GROUP BY status""",
+        (project_id,),
+    ).fetchall())
+
+
 def update_task_status(
     db: sqlite3.Connection,
     task_id: str,
     status: str,
 ) -> Task | None:
     """Update a task's status. Returns the updated task."""
-    task = get_task(db, task_id)
+    task = update_task_status_returning(db, task_id, status)
     if not task:
         return None
+    return _load_relations(db, task)
 
-    old_status = task.status
-    updates = {"status": status}
-
-    if status == "done" and old_status != "done":
-        updates["completed_at"] = datetime.now().isoformat()
 
-    set_parts = [f"{k} = ?" for k in updates]
-    set_parts.append("updated_at = datetime('now')")
-    values = list(updates.values()) + [task_id]
-
-    db.execute(
-        f"UPDATE tasks SET {', '.join(set_parts)} WHERE id = ?",
-        values,
+def update_task_status_returning(
+    db: sqlite3.Connection,
+    task_id: str,
+    status: str,
+    commit: bool = True,
+) -> Task | None:
+    """Update a task's status and return the updated row without re-reading it.
+
+    The returned task carries its project's repo path and Slack channel but
+    has no dependencies or subtasks loaded; use update_task_status when those
+    are needed. Pass commit=False to leave the write in the caller's
+    transaction.
+    """
+    updated = _update_task_column(
+        db,
+        task_id,
+        "status",
+        status,
+        extra_set="completed_at = CASE WHEN ? = 'done' AND status != 'done' THEN ? ELSE completed_at END",
+        extra_params=(status, datetime.now().isoformat()),
+        returning="""*,
+               (SELECT repo_path FROM projects WHERE id = project_id) AS project_repo_path,
+               (SELECT slack_channel FROM projects WHERE id = project_id) AS project_slack_channel""",
     )
+    if not updated:
+        return None
+    old_status, row = updated
     _log_event(db, task_id, "status_changed", old_status, status)
-    db.commit()
-    return get_task(db, task_id)
+    if commit:
+        db.commit()
+    return _row_to_task(row)
+
+
+def _update_task_column(
+    db: sqlite3.Connection,
+    task_id: str,
+    column: str,
+    value,
+    extra_set: str = "",
+    extra_params: tuple = (),
+    returning: str = "*",
+) -> tuple | None:
+    """Set one column of a task, returning (old value, updated row).
+
+    Returns None if the task does not exist. The update runs before the
+    caller logs the change, so a rejected value (e.g. a CHECK constraint)
+    leaves no event behind. It only applies while the column still holds the
+    value just read, so the old value is exact even if another connection
+    changed it in between; the read is retried in that case.
+    """
+    set_clause = f"{column} = ?, " + (f"{extra_set}, " if extra_set else "")
+    while True:
+        old = db.execute(f"SELECT {column} FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        if not old:
+            return None
+        row = db.execute(
+            f"""UPDATE tasks SET {set_clause}updated_at = datetime('now')
+                WHERE id = ? AND {column} IS ?
+                RETURNING {returning}""",
+            (value, *extra_params, task_id, old[0]),
+        ).fetchone()
+        if row:
+            return old[0], row
 
 
 def break_down_task(
@@ -159,36 +328,47 @@ def break_down_task(
     subtasks: list[dict],
 ) -> list[Task]:
     """Break a task into subtasks. Each dict should have 'title' and optionally 'description' and 'depends_on'."""
+    parent = db.execute("SELECT project_id FROM tasks WHERE id = ?", (task_id,)).fetchone()
+    if not parent:
+        raise ValueError(f"Task not found: {task_id}")
+
+    # All subtasks commit together (or not at all)
     created = []
-    for sub in subtasks:
-        t = create_task(
-            db,
-            title=sub["title"],
-            project_id=get_task(db, task_id).project_id,
-            description=sub.get("description", ""),
-            parent_task_id=task_id,
-            depends_on=sub.get("depends_on"),
-            priority=sub.get("priority", 3),
-        )
-        created.append(t)
+    with db:
+        for sub in subtasks:
+            t = create_task(
+                db,
+                title=sub["title"],
+                project_id=parent["project_id"],
+                description=sub.get("description", ""),
+                parent_task_id=task_id,
+                depends_on=sub.get("depends_on"),
+                priority=sub.get("priority", 3),
+                commit=False,
+            )
+            created.append(t)
     return created
 
 
 def delete_task(db: sqlite3.Connection, task_id: str) -> bool:
     """Delete a task and its subtasks."""
-    task = get_task(db, task_id)
-    if not task:
-        return False
-
-    # Delete subtasks first
-    for subtask in task.subtasks:
-        delete_task(db, subtask.id)
-
-    db.execute("DELETE FROM task_dependencies WHERE task_id = ? OR depends_on_task_id = ?", (task_id, task_id))
-    db.execute("DELETE FROM task_events WHERE task_id = ?", (task_id,))
-    db.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+    # One statement over the whole subtree; dependencies and events go with
+    # it through ON DELETE CASCADE. The CTE sits in a subquery so the statement
+    # still starts with DELETE, which sqlite3 needs to open a transaction and
+    # report rowcount.
+    cur = db.execute(
+        """DELETE FROM tasks WHERE id IN (
+               WITH RECURSIVE subtree(id) AS (
+                   SELECT id FROM tasks WHERE id = ?
+                   UNION ALL
+                   SELECT t.id FROM tasks t JOIN subtree ON t.parent_task_id = subtree.id
+               )
+               SELECT id FROM subtree
+           )""",
+        (task_id,),
+    )
     db.commit()
-    return True
+    return cur.rowcount > 0
 
 
 def get_task_events(db: sqlite3.Connection, task_id: str) -> list[TaskEvent]:
@@ -212,33 +392,52 @@ def get_task_events(db: sqlite3.Connection, task_id: str) -> list[TaskEvent]:
 
 def get_blocked_tasks(db: sqlite3.Connection, project_id: str = "default") -> list[Task]:
     """Get tasks whose dependencies are not all 'done'."""
-    tasks = list_tasks(db, project_id, status="todo")
-    blocked = []
-    for task in tasks:
-        if task.depends_on:
-            for dep_id in task.depends_on:
-                dep = get_task(db, dep_id)
-                if dep and dep.status != "done":
-                    blocked.append(task)
-                    break
-    return blocked
+    return _list_todo_tasks(
+        db,
+        project_id,
+        """EXISTS (SELECT 1 FROM task_dependencies d
+                      JOIN tasks dt ON dt.id = d.depends_on_task_id
+                      WHERE d.task_id = t.id AND dt.status != 'done')""",
+    )
 
 
 def get_ready_tasks(db: sqlite3.Connection, project_id: str = "default") -> list[Task]:
     """Get tasks that are 'todo' and have all dependencies met."""
-    tasks = list_tasks(db, project_id, status="todo")
-    ready = []
-    for task in tasks:
-        if not task.depends_on:
-            ready.append(task)
-            continue
-        all_done = all(
-            (dep := get_task(db, dep_id)) and dep.status == "done"
-            for dep_id in task.depends_on
-        )
-        if all_done:
-            ready.append(task)
-    return ready
+    # A dependency on a task that no longer exists counts as unmet
+    return _list_todo_tasks(
+        db,
+        project_id,
+        """NOT EXISTS (SELECT 1 FROM task_dependencies d
+                          LEFT JOIN tasks dt ON dt.id = d.depends_on_task_id
+                          WHERE d.task_id = t.id
+                            AND (dt.id IS NULL OR dt.status != 'done'))""",
+    )
+
+
+def _list_todo_tasks(db: sqlite3.Connection, project_id: str, condition: str) -> list[Task]:
+    """List top-level 'todo' tasks matching an SQL condition on alias t."""
+    rows = db.execute(
+        f"""SELECT t.*,
+                   (SELECT json_group_array(depends_on_task_id) FROM task_dependencies
+                    WHERE task_id = t.id) AS depends_on_json
+            FROM tasks t
+            WHERE t.project_id = ? AND t.status = 'todo' AND t.parent_task_id IS NULL
+              AND {condition}
+            ORDER BY t.priority ASC, t.created_at ASC""",
+        (project_id,),
+    )
+    tasks = []
+    for r in rows:
+        task = _row_to_task(r)
+        task.depends_on = json.loads(r["depends_on_json"])
+        tasks.append(task)
+    return tasks
+
+
+# Shared by both loggers so they hit the same cached prepared statement
+_INSERT_EVENT_SQL = (
+    "INSERT INTO task_events (task_id, event_type, old_value, new_value) VALUES (?, ?, ?, ?)"
+)
 
 
 def _log_event(
@@ -248,10 +447,15 @@ def _log_event(
     old_value: str | None,
     new_value: str | None,
 ):
-    db.execute(
-        "INSERT INTO task_events (task_id, event_type, old_value, new_value) VALUES (?, ?, ?, ?)",
-        (task_id, event_type, old_value, new_value),
-    )
+    db.execute(_INSERT_EVENT_SQL, (task_id, event_type, old_value, new_value))
+
+
+def _log_events(
+    db: sqlite3.Connection,
+    events: list[tuple[str, str, str | None, str | None]],
+):
+    """Log several (task_id, event_type, old_value, new_value) events at once."""
+    db.executemany(_INSERT_EVENT_SQL, events)
 
 
 def update_task_pr_url(
@@ -260,17 +464,13 @@ def update_task_pr_url(
     pr_url: str | None,
 ) -> Task | None:
     """Set or clear a task's PR URL."""
-    task = get_task(db, task_id)
-    if not task:
+    updated = _update_task_column(db, task_id, "pr_url", pr_url)
+    if not updated:
         return None
-    old_url = task.pr_url
-    db.execute(
-        "UPDATE tasks SET pr_url = ?, updated_at = datetime('now') WHERE id = ?",
-        (pr_url, task_id),
-    )
+    old_url, row = updated
     _log_event(db, task_id, "pr_url_changed", old_url, pr_url)
     db.commit()
-    return get_task(db, task_id)
+    return _load_relations(db, _row_to_task(row))
 
 
 def update_task_priority(
@@ -279,18 +479,15 @@ def update_task_priority(
     priority: int,
 ) -> Task | None:
     """Update a task's priority (P0-P6, 0=highest)."""
-    task = get_task(db, task_id)
-    if not task:
-        return None
     priority = max(0, min(6, priority))
-    old_priority = task.priority
-    db.execute(
-        "UPDATE tasks SET priority = ?, updated_at = datetime('now') WHERE id = ?",
-        (priority, task_id),
-    )
+    updated = _update_task_column(db, task_id, "priority", priority)
+    if not updated:
+        return None
+    old_priority, row = updated
+    old_priority = 3 if old_priority is None else old_priority
     _log_event(db, task_id, "priority_changed", str(old_priority), str(priority))
     db.commit()
-    return get_task(db, task_id)
+    return _load_relations(db, _row_to_task(row))
 
 
 def add_dependency(
@@ -302,8 +499,7 @@ def add_dependency(
     task = get_task(db, task_id)
     if not task:
         return None
-    dep = get_task(db, depends_on_id)
-    if not dep:
+    if not db.execute("SELECT 1 FROM tasks WHERE id = ?", (depends_on_id,)).fetchone():
         raise ValueError(f"Dependency task not found: {depends_on_id}")
     if depends_on_id in task.depends_on:
         return task  # Already exists
@@ -313,7 +509,8 @@ def add_dependency(
     )
     _log_event(db, task_id, "dependency_added", None, depends_on_id)
     db.commit()
-    return get_task(db, task_id)
+    task.depends_on.append(depends_on_id)
+    return task
 
 
 def remove_dependency(
@@ -331,7 +528,27 @@ def remove_dependency(
     )
     _log_event(db, task_id, "dependency_removed", depends_on_id, None)
     db.commit()
-    return get_task(db, task_id)
+    task.depends_on = [d for d in task.depends_on if d != depends_on_id]
+    return task
+
+
+def _load_dependencies(db: sqlite3.Connection, tasks: list[Task]):
+    """Fill depends_on for all of the given tasks with a single query.
+
+    IDs are bound as one JSON array rather than one placeholder each, so the
+    SQL text, and with it the cached prepared statement, is the same for any
+    number of tasks.
+    """
+    if not tasks:
+        return
+    by_id = {t.id: t for t in tasks}
+    deps = db.execute(
+        """SELECT task_id, depends_on_task_id FROM task_dependencies
+           WHERE task_id IN (SELECT value FROM json_each(?))""",
+        (json.dumps(list(by_id)),),
+    )
+    for d in deps:
+        by_id[d["task_id"]].depends_on.append(d["depends_on_task_id"])
 
 
 def _row_to_task(row: sqlite3.Row) -> Task:
@@ -340,7 +557,7 @@ def _row_to_task(row: sqlite3.Row) -> Task:
         agent_backend = row["agent_backend"]
     except (IndexError, KeyError):
         agent_backend = None
-    return Task(
+    task = Task(
         id=row["id"],
         project_id=row["project_id"],
         title=row["title"],
@@ -356,6 +573,11 @@ def _row_to_task(row: sqlite3.Row) -> Task:
         updated_at=_parse_dt(row["updated_at"]),
         completed_at=_parse_dt(row["completed_at"]),
     )
+    # sqlite3.Row's `in` tests values, not column names, so keys() is needed
+    if "project_repo_path" in row.keys():  # noqa: SIM118
+        task.project_repo_path = row["project_repo_path"]
+        task.project_slack_channel = row["project_slack_channel"]
+    return task
 
 
 def _parse_dt(val: str | None) -> datetime | None:
@@ -1,9 +1,12 @@
 """Git worktree lifecycle management tied to tasks."""
 
+import json
+import os
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from work_orchestrator.core.tasks import get_task, _log_event
+from work_orchestrator.core.tasks import get_task, _log_event, _log_events
 import logging
 
 from work_orchestrator.integrations.git import (
@@ -20,6 +23,9 @@ from work_orchestrator.integrations.git import (
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent git processes when cleaning up many worktrees
+_MAX_CLEANUP_WORKERS = min(8, os.cpu_count() or 1)
+
 
 def create_worktree_for_task(
     db: sqlite3.Connection,
@@ -30,7 +36,7 @@ def create_worktree_for_task(
     branch_name: str | None = None,
 ) -> dict:
     """Create a git worktree for a task. Returns worktree info dict."""
-    task = get_task(db, task_id)
+    task = get_task(db, task_id, include_subtasks=False)
     if not task:
         raise ValueError(f"Task not found: {task_id}")
 
@@ -76,7 +82,7 @@ def remove_worktree_for_task(
     delete_branch_after: bool = False,
 ) -> dict:
     """Remove the worktree for a task."""
-    task = get_task(db, task_id)
+    task = get_task(db, task_id, include_subtasks=False)
     if not task:
         raise ValueError(f"Task not found: {task_id}")
 
@@ -84,15 +90,34 @@ def remove_worktree_for_task(
         return {"task_id": task_id, "removed": False, "reason": "No worktree assigned"}
 
     wt_path = Path(task.worktree_path)
-    branch = task.branch_name
-    repo = Path(repo_path)
+    reason = _remove_worktree_files(
+        Path(repo_path), wt_path, task.branch_name, force, delete_branch_after
+    )
+    if reason:
+        return {"task_id": task_id, "removed": False, "reason": reason}
+
+    _clear_task_worktree(db, task_id, wt_path, "worktree_removed")
+    return {"task_id": task_id, "removed": True, "path": str(wt_path)}
+
 
+def _remove_worktree_files(
+    repo: Path,
+    wt_path: Path,
+    branch: str | None,
+    force: bool,
+    delete_branch_after: bool,
+) -> str | None:
+    """Remove a worktree (and optionally its branch) from disk.
+
+    Touches git and the filesystem only, never the DB. Returns the reason
+    if git refused a non-forced removal.
+    """
     if wt_path.exists():
         try:
             worktree_remove(repo, wt_path, force=force)
         except GitError as e:
             if not force:
-                return {"task_id": task_id, "removed": False, "reason": str(e)}
+                return str(e)
             raise
 
     if delete_branch_after and branch and branch_exists(repo, branch):
@@ -100,16 +125,22 @@ def remove_worktree_for_task(
             delete_branch(repo, branch, force=force)
         except GitError:
             pass  # Branch deletion is best-effort
+    return None
 
+
+def _clear_task_worktree(
+    db: sqlite3.Connection,
+    task_id: str,
+    wt_path: Path,
+    event_type: str,
+):
     db.execute(
         "UPDATE tasks SET worktree_path = NULL, updated_at = datetime('now') WHERE id = ?",
         (task_id,),
     )
-    _log_event(db, task_id, "worktree_removed", str(wt_path), None)
+    _log_event(db, task_id, event_type, str(wt_path), None)
     db.commit()
 
-    return {"task_id": task_id, "removed": True, "path": str(wt_path)}
-
 
 def list_task_worktrees(
     db: sqlite3.Connection,
@@ -117,15 +148,13 @@ def list_task_worktrees(
 ) -> list[dict]:
     """List all worktrees and match them to tasks."""
     git_worktrees = worktree_list(repo_path)
+    # Served by the partial idx_tasks_worktree, which holds only these rows
     task_rows = db.execute(
-        "SELECT id, title, status, branch_name, worktree_path FROM tasks WHERE worktree_path IS NOT NULL"
+        "SELECT id, title, status, worktree_path FROM tasks WHERE worktree_path IS NOT NULL"
     ).fetchall()
 
     # Use resolved paths for comparison (handles macOS /private symlinks etc.)
-    task_by_path = {}
-    for row in task_rows:
-        resolved = str(Path(row["worktree_path"]).resolve())
-        task_by_path[resolved] = dict(row)
+    task_by_path = {str(Path(row["worktree_path"]).resolve()): row for row in task_rows}
 
     result = []
     for wt in git_worktrees:
@@ -150,7 +179,7 @@ def get_worktree_status(
     task_id: str,
 ) -> dict:
     """Get git status for a task's worktree."""
-    task = get_task(db, task_id)
+    task = get_task(db, task_id, include_subtasks=False)
     if not task:
         raise ValueError(f"Task not found: {task_id}")
     if not task.worktree_path:
@@ -180,18 +209,58 @@ def cleanup_done_worktrees(
     If recycle=True, resets the worktree branch instead of removing it,
     leaving the slot ready for reuse without recreating the worktree.
     """
-    tasks = db.execute(
-        "SELECT id FROM tasks WHERE project_id = ? AND status = 'done' AND worktree_path IS NOT NULL",
+    rows = db.execute(
+        """SELECT id, worktree_path, branch_name FROM tasks
+           WHERE project_id = ? AND status = 'done' AND worktree_path IS NOT NULL""",
         (project_id,),
     ).fetchall()
+    if not rows:
+        return []
+    repo = Path(repo_path)
 
+    def git_cleanup(row) -> str | None:
+        wt_path = Path(row["worktree_path"])
+        # Report git and filesystem failures as this row's reason rather than
+        # raising, so one bad worktree does not stop the others from being
+        # detached below
+        try:
+            if not recycle:
+                return _remove_worktree_files(repo, wt_path, row["branch_name"], False, False)
+            if not wt_path.exists():
+                return "Worktree path does not exist"
+            return _reset_worktree(row["id"], wt_path, "main")
+        except (GitError, OSError) as e:
+            logger.warning("Failed to clean up worktree for %s: %s", row["id"], e)
+            return str(e) or type(e).__name__
+
+    # Each worktree's git work is subprocess and filesystem bound, so run it
+    # concurrently; the DB updates stay on this thread (and this connection)
+    with ThreadPoolExecutor(max_workers=min(_MAX_CLEANUP_WORKERS, len(rows))) as pool:
+        reasons = list(pool.map(git_cleanup, rows))
+
+    done_key = "recycled" if recycle else "removed"
+    event_type = "worktree_recycled" if recycle else "worktree_removed"
     results = []
-    for row in tasks:
-        if recycle:
-            result = recycle_worktree(db, row["id"], repo_path)
-        else:
-            result = remove_worktree_for_task(db, row["id"], repo_path)
-        results.append(result)
+    cleared = []
+    for row, reason in zip(rows, reasons):
+        task_id = row["id"]
+        if reason:
+            results.append({"task_id": task_id, done_key: False, "reason": reason})
+            continue
+        cleared.append(row)
+        results.append({"task_id": task_id, done_key: True, "path": row["worktree_path"]})
+
+    # Detach every cleaned-up worktree in one transaction
+    if cleared:
+        with db:
+            db.execute(
+                """UPDATE tasks SET worktree_path = NULL, updated_at = datetime('now')
+                   WHERE id IN (SELECT value FROM json_each(?))""",
+                (json.dumps([row["id"] for row in cleared]),),
+            )
+            _log_events(
+                db, [(row["id"], event_type, row["worktree_path"], None) for row in cleared]
+            )
     return results
 
 
@@ -209,7 +278,7 @@ def recycle_worktree(
 
     Flow: checkout base → reset --hard → clean -fd → clear task worktree_path
     """
-    task = get_task(db, task_id)
+    task = get_task(db, task_id, include_subtasks=False)
     if not task:
         raise ValueError(f"Task not found: {task_id}")
 
@@ -220,6 +289,17 @@ def recycle_worktree(
     if not wt_path.exists():
         return {"task_id": task_id, "recycled": False, "reason": "Worktree path does not exist"}
 
+    reason = _reset_worktree(task_id, wt_path, base_branch)
+    if reason:
+        return {"task_id": task_id, "recycled": False, "reason": reason}
+
+    # Clear the task's worktree association
+    _clear_task_worktree(db, task_id, wt_path, "worktree_recycled")
+    return {"task_id": task_id, "recycled": True, "path": str(wt_path)}
+
+
+def _reset_worktree(task_id: str, wt_path: Path, base_branch: str) -> str | None:
+    """Reset a worktree to base_branch and clean it. Returns the reason on failure."""
     try:
         # Reset the worktree to a clean state
         run_git(["checkout", base_branch], cwd=wt_path)
@@ -233,14 +313,5 @@ def recycle_worktree(
             run_git(["clean", "-fd"], cwd=wt_path)
         except GitError as e:
             logger.warning("Failed to recycle worktree for %s: %s", task_id, e)
-            return {"task_id": task_id, "recycled": False, "reason": str(e)}
-
-    # Clear the task's worktree association
-    db.execute(
-        "UPDATE tasks SET worktree_path = NULL, updated_at = datetime('now') WHERE id = ?",
-        (task_id,),
-    )
-    _log_event(db, task_id, "worktree_recycled", str(wt_path), None)
-    db.commit()
-
-    return {"task_id": task_id, "recycled": True, "path": str(wt_path)}
+            return str(e)
+    return None
@@ -1,5 +1,6 @@
 """SQLite database connection management and schema initialization."""
 
+import re
 import sqlite3
 from contextlib import contextmanager
 from pathlib import Path
@@ -73,7 +74,7 @@ CREATE TABLE IF NOT EXISTS worktree_slots (
     path TEXT NOT NULL UNIQUE,
     label TEXT NOT NULL,
     branch TEXT,
-    status TEXT DEFAULT 'available' CHECK (status IN ('available', 'occupied')),
+    status TEXT DEFAULT 'available' CHECK (status IN ('available', 'occupied', 'draining')),
     current_task_id TEXT REFERENCES tasks(id),
     created_at TEXT DEFAULT (datetime('now')),
     updated_at TEXT DEFAULT (datetime('now'))
@@ -112,6 +113,16 @@ CREATE TABLE IF NOT EXISTS planning_messages (
     content TEXT NOT NULL,
     created_at TEXT DEFAULT (datetime('now'))
 );
+
+CREATE INDEX IF NOT EXISTS idx_tasks_worktree ON tasks(project_id, status)
+    WHERE worktree_path IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_task_deps_depends_on ON task_dependencies(depends_on_task_id);
+CREATE INDEX IF NOT EXISTS idx_task_events_task ON task_events(task_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_agent_runs_running ON agent_runs(status) WHERE status = 'running';
+CREATE INDEX IF NOT EXISTS idx_agent_runs_task_started ON agent_runs(task_id, started_at DESC);
+CREATE INDEX IF NOT EXISTS idx_worktree_slots_task ON worktree_slots(current_task_id)
+    WHERE current_task_id IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_memories_project_category ON memories(project_id, category, updated_at DESC);
 """
 
 FTS_SCHEMA = """
@@ -137,9 +148,24 @@ CREATE TRIGGER IF NOT EXISTS memories_au AFTER UPDATE ON memories BEGIN
 END;
 """
 
+# Indexes on columns that _run_migrations adds to older databases, so they
+# can only be created once the migrations have run
+MIGRATED_INDEX_SCHEMA = """
+CREATE INDEX IF NOT EXISTS idx_tasks_list ON tasks(project_id, parent_task_id, priority, created_at);
+CREATE INDEX IF NOT EXISTS idx_tasks_parent ON tasks(parent_task_id, priority, created_at);
+"""
+
+
+# Bump whenever _run_migrations gains a step; databases already at this
+# version skip migrations entirely
+SCHEMA_VERSION = 1
+
 
 def _run_migrations(conn: sqlite3.Connection):
     """Run schema migrations idempotently."""
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+        return
+
     migrations = [
         "ALTER TABLE tasks ADD COLUMN pr_url TEXT",
         "ALTER TABLE tasks ADD COLUMN priority INTEGER DEFAULT 3",
@@ -154,56 +180,151 @@ def _run_migrations(conn: sqlite3.Connection):
         except sqlite3.OperationalError:
             pass  # Column already exists
 
-    # Migrate CHECK constraint to include 'review' status
-    table_sql = conn.execute(
-        "SELECT sql FROM sqlite_master WHERE name='tasks' AND type='table'"
-    ).fetchone()
-    if table_sql and "'review'" not in table_sql[0]:
-        new_sql = table_sql[0].replace(
-            "('todo', 'in-progress', 'done', 'blocked')",
-            "('todo', 'in-progress', 'done', 'blocked', 'review')",
+    # Widen CHECK constraints on databases created before 'review' and 'draining'
+    _replace_in_table_sql(
+        conn,
+        "tasks",
+        "('todo', 'in-progress', 'done', 'blocked')",
+        "('todo', 'in-progress', 'done', 'blocked', 'review')",
+    )
+    _replace_in_table_sql(
+        conn,
+        "worktree_slots",
+        "('available', 'occupied')",
+        "('available', 'occupied', 'draining')",
+    )
+
+    # Superseded by idx_tasks_list, which has the same leading columns
+    conn.execute("DROP INDEX IF EXISTS idx_tasks_project_parent")
+
+    # One memory per key and scope, including global (NULL project) memories
+    # that UNIQUE(key, project_id) does not constrain; keep the newest duplicate
+    if not conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name='idx_memories_key_scope'"
+    ).fetchone():
+        conn.execute(
+            """DELETE FROM memories WHERE id NOT IN
+               (SELECT MAX(id) FROM memories GROUP BY key, COALESCE(project_id, ''))"""
         )
-        conn.execute("PRAGMA writable_schema=ON")
         conn.execute(
-            "UPDATE sqlite_master SET sql=? WHERE name='tasks' AND type='table'",
-            (new_sql,),
+            "CREATE UNIQUE INDEX idx_memories_key_scope ON memories(key, COALESCE(project_id, ''))"
         )
-        conn.execute("PRAGMA writable_schema=OFF")
 
-    # Migrate worktree_slots CHECK constraint to include 'draining'
-    slot_sql = conn.execute(
-        "SELECT sql FROM sqlite_master WHERE name='worktree_slots' AND type='table'"
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    conn.commit()
+
+
+def _replace_in_table_sql(conn: sqlite3.Connection, table: str, old: str, new: str):
+    """Rewrite part of a table's definition by rebuilding the table.
+
+    Follows SQLite's documented procedure for schema changes ALTER TABLE
+    cannot make: create the new definition under a temporary name, copy the
+    rows, drop the old table, rename, then restore its indexes and triggers.
+    Does nothing if the definition does not contain old.
+    """
+    row = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
     ).fetchone()
-    if slot_sql and "'draining'" not in slot_sql[0]:
-        new_sql = slot_sql[0].replace(
-            "('available', 'occupied')",
-            "('available', 'occupied', 'draining')",
-        )
-        conn.execute("PRAGMA writable_schema=ON")
+    if not row or old not in row[0]:
+        return
+    conn.commit()
+    # Must be switched off outside a transaction; otherwise dropping the old
+    # table would cascade into every table that references it
+    conn.execute("PRAGMA foreign_keys=OFF")
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        # Re-read under the write lock in case another process migrated first
+        table_sql = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+        ).fetchone()[0]
+        if old not in table_sql:
+            conn.rollback()
+            return
+        dependents = [
+            r[0]
+            for r in conn.execute(
+                """SELECT sql FROM sqlite_master
+                   WHERE tbl_name = ? AND type IN ('index', 'trigger') AND sql IS NOT NULL""",
+                (table,),
+            )
+        ]
+        tmp = f"{table}_new"
+        # A table that was itself renamed has its name stored quoted
         conn.execute(
-            "UPDATE sqlite_master SET sql=? WHERE name='worktree_slots' AND type='table'",
-            (new_sql,),
+            re.sub(rf'^CREATE TABLE "?{table}"?', f"CREATE TABLE {tmp}", table_sql.replace(old, new))
         )
-        conn.execute("PRAGMA writable_schema=OFF")
+        conn.execute(f"INSERT INTO {tmp} SELECT * FROM {table}")
+        conn.execute(f"DROP TABLE {table}")
+        conn.execute(f"ALTER TABLE {tmp} RENAME TO {table}")
+        # Rows are copied verbatim, so references into the table stay valid
+        for sql in dependents:
+            conn.execute(sql)
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        conn.execute("PRAGMA foreign_keys=ON")
 
-    conn.commit()
 
+# Prepared statements kept per connection. The app issues roughly a hundred
+# distinct SQL strings (plus filter variants), which a long-lived MCP or web
+# connection cycles through; the default of 128 would start evicting them.
+_CACHED_STATEMENTS = 256
+
+
+def configure_connection(conn: sqlite3.Connection):
+    """Apply the per-connection PRAGMAs shared by read-write and read-only connections."""
+    conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache
+    conn.execute("PRAGMA mmap_size=268435456")  # map up to 256 MB of the file
 
-def init_db(db_path: Path) -> sqlite3.Connection:
+
+def init_db(db_path: Path, check_same_thread: bool = True) -> sqlite3.Connection:
     """Initialize the database, creating tables if needed."""
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(db_path), timeout=10)
+    # Implicit transactions start with BEGIN IMMEDIATE, so a writer claims the
+    # write lock up front (waiting out busy_timeout) instead of failing with
+    # SQLITE_BUSY when it later upgrades from a read
+    conn = sqlite3.connect(
+        str(db_path),
+        timeout=10,
+        check_same_thread=check_same_thread,
+        isolation_level="IMMEDIATE",
+        cached_statements=_CACHED_STATEMENTS,
+    )
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute("PRAGMA synchronous=NORMAL")
     conn.execute("PRAGMA foreign_keys=ON")
+    configure_connection(conn)
     conn.executescript(SCHEMA)
     conn.executescript(FTS_SCHEMA)
     _run_migrations(conn)
+    conn.executescript(MIGRATED_INDEX_SCHEMA)
     conn.commit()
     return conn
 
 
+def connect_readonly(db_path: Path) -> sqlite3.Connection:
+    """Open a read-only connection to an existing database.
+
+    With WAL enabled, reads on this connection never wait on writers.
+    """
+    uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+    conn = sqlite3.connect(
+        uri,
+        uri=True,
+        timeout=10,
+        check_same_thread=False,
+        cached_statements=_CACHED_STATEMENTS,
+    )
+    conn.row_factory = sqlite3.Row
+    configure_connection(conn)
+    return conn
+
+
 @contextmanager
 def get_db(db_path: Path):
     """Context manager for database connections."""
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     id: str
     name: str
@@ -16,7 +16,7 @@ class Project:
     updated_at: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     id: str
     project_id: str
@@ -33,10 +33,14 @@ class Task:
     updated_at: datetime | None = None
     completed_at: datetime | None = None
     depends_on: list[str] = field(default_factory=list)
-    subtasks: list["Task"] = field(default_factory=list)
+    # Left out of repr so logging a task does not dump its whole subtree
+    subtasks: list["Task"] = field(default_factory=list, repr=False)
+    # Only set by queries that join the task's project
+    project_repo_path: str | None = None
+    project_slack_channel: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Memory:
     id: int | None = None
     key: str = ""
@@ -47,7 +51,7 @@ class Memory:
     updated_at: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskEvent:
     id: int | None = None
     task_id: str = ""
@@ -57,7 +61,7 @@ class TaskEvent:
     created_at: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WorktreeSlot:
     id: int | None = None
     project_id: str = ""
@@ -70,7 +74,7 @@ class WorktreeSlot:
     updated_at: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentRun:
     id: int | None = None
     task_id: str = ""
@@ -88,7 +92,7 @@ class AgentRun:
     completed_at: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Spec:
     id: str = ""
     project_id: str | None = None
@@ -99,7 +103,7 @@ class Spec:
     updated_at: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PlanningSession:
     id: str = ""
     project_id: str = ""
@@ -110,7 +114,7 @@ class PlanningSession:
     updated_at: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PlanningMessage:
     id: int | None = None
     session_id: str = ""
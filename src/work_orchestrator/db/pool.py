@@ -0,0 +1,96 @@
+"""SQLite connection pool: one read-write connection plus N read-only readers."""
+
+import atexit
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+from work_orchestrator.db.engine import connect_readonly, init_db
+
+
+class ConnectionPool:
+    """Single-writer / multi-reader pool for one database file.
+
+    The writer is created (and the schema initialized) when the pool is
+    built; writes are serialized with a lock. Readers are opened lazily as
+    read-only connections and kept on a LIFO stack so the most recently used
+    (warmest page cache) connection is handed out first. With WAL enabled,
+    readers do not block on the writer.
+    """
+
+    def __init__(self, db_path: Path, max_readers: int | None = None):
+        self.db_path = Path(db_path)
+        self.max_readers = max_readers or os.cpu_count() or 4
+        self._writer = init_db(self.db_path, check_same_thread=False)
+        self._write_lock = threading.Lock()
+        self._idle_readers: list[sqlite3.Connection] = []
+        self._all_readers: list[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+        self._reader_slots = threading.BoundedSemaphore(self.max_readers)
+
+    @contextmanager
+    def get_writer(self):
+        """Yield the read-write connection, holding the write lock.
+
+        Any pending transaction is committed on exit, or rolled back if the
+        block raised, so nothing leaks into the next checkout.
+        """
+        with self._write_lock, self._writer:
+            yield self._writer
+
+    @contextmanager
+    def get_reader(self):
+        """Yield a read-only connection, blocking if all readers are busy."""
+        with self._reader_slots:
+            with self._readers_lock:
+                conn = self._idle_readers.pop() if self._idle_readers else None
+            if conn is None:
+                conn = self._connect_reader()
+            try:
+                yield conn
+            finally:
+                with self._readers_lock:
+                    self._idle_readers.append(conn)
+
+    def close(self):
+        """Close the writer and every reader opened by this pool."""
+        with self._readers_lock:
+            for conn in self._all_readers:
+                conn.close()
+            self._all_readers.clear()
+            self._idle_readers.clear()
+        with self._write_lock:
+            self._writer.close()
+
+    def _connect_reader(self) -> sqlite3.Connection:
+        conn = connect_readonly(self.db_path)
+        with self._readers_lock:
+            self._all_readers.append(conn)
+        return conn
+
+
+_pools: dict[Path, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: Path) -> ConnectionPool:
+    """Return the process-wide pool for db_path, creating it on first use."""
+    key = Path(db_path)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = ConnectionPool(key)
+        return pool
+
+
+def close_pools():
+    """Close every pool created by get_pool()."""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
+        _pools.clear()
+
+
+atexit.register(close_pools)
@@ -1,5 +1,6 @@
 """Git subprocess wrappers for worktree and branch operations."""
 
+import re
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
@@ -9,7 +10,7 @@ class GitError(Exception):
     """Raised when a git command fails."""
 
 
-@dataclass
+@dataclass(slots=True)
 class WorktreeInfo:
     path: str
     branch: str
@@ -25,7 +26,11 @@ def run_git(args: list[str], cwd: str | Path | None = None) -> str:
             cmd,
             cwd=cwd,
             capture_output=True,
-            text=True,
+            # Git emits UTF-8 (paths, branch names) regardless of the locale;
+            # surrogateescape keeps non-UTF-8 path bytes, which os and Path
+            # functions encode back to the original name
+            encoding="utf-8",
+            errors="surrogateescape",
             check=True,
         )
         return result.stdout.strip()
@@ -52,46 +57,29 @@ def worktree_add(
     return run_git(args, cwd=repo_path)
 
 
+# One record of `git worktree list --porcelain`. A bare worktree has no HEAD
+# line, a detached one has "detached" instead of a branch line, and trailing
+# attributes (locked, prunable) are skipped by scanning to the next record.
+_WORKTREE_RE = re.compile(
+    r"^worktree (?P<path>.*)$"
+    r"(?:\nHEAD (?P<head>.*)$)?"
+    r"(?:\nbranch (?:refs/heads/)?(?P<branch>.*)$|\n(?P<bare>bare)$)?",
+    re.MULTILINE,
+)
+
+
 def worktree_list(repo_path: str | Path) -> list[WorktreeInfo]:
     """List all worktrees in porcelain format."""
     output = run_git(["worktree", "list", "--porcelain"], cwd=repo_path)
-    worktrees = []
-    current: dict = {}
-
-    for line in output.split("\n"):
-        if not line:
-            if current:
-                worktrees.append(
-                    WorktreeInfo(
-                        path=current.get("worktree", ""),
-                        branch=current.get("branch", "").replace("refs/heads/", ""),
-                        head=current.get("HEAD", ""),
-                        is_bare=current.get("bare", False),
-                    )
-                )
-                current = {}
-            continue
-
-        if line.startswith("worktree "):
-            current["worktree"] = line[len("worktree "):]
-        elif line.startswith("HEAD "):
-            current["HEAD"] = line[len("HEAD "):]
-        elif line.startswith("branch "):
-            current["branch"] = line[len("branch "):]
-        elif line == "bare":
-            current["bare"] = True
-
-    if current:
-        worktrees.append(
-            WorktreeInfo(
-                path=current.get("worktree", ""),
-                branch=current.get("branch", "").replace("refs/heads/", ""),
-                head=current.get("HEAD", ""),
-                is_bare=current.get("bare", False),
-            )
+    return [
+        WorktreeInfo(
+            path=m["path"],
+            branch=m["branch"] or "",
+            head=m["head"] or "",
+            is_bare=m["bare"] is not None,
         )
-
-    return worktrees
+        for m in _WORKTREE_RE.finditer(output)
+    ]
 
 
 def worktree_remove(repo_path: str | Path, worktree_path: str | Path, force: bool = False) -> str:
@@ -1,7 +1,19 @@
 """Slack Web API integration."""
 
+import functools
+import threading
+from collections import Counter
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 
+_STATUS_EMOJI = {
+    "todo": ":white_circle:",
+    "in-progress": ":large_blue_circle:",
+    "done": ":white_check_mark:",
+    "blocked": ":red_circle:",
+}
+
 
 class SlackError(Exception):
     """Raised when a Slack operation fails."""
@@ -14,12 +26,22 @@ class SlackMessage:
     text: str
 
 
+@functools.lru_cache(maxsize=4)
 def get_client(token: str | None):
-    """Get a Slack WebClient. Returns None if no token provided."""
+    """Get a Slack WebClient. Returns None if no token provided.
+
+    Clients are cached per token, so repeated notifications reuse one. On
+    top of the default connection-error retry, rate-limited (429) calls are
+    retried after the Retry-After delay Slack sends.
+    """
     if not token:
         return None
     from slack_sdk import WebClient
-    return WebClient(token=token)
+    from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
+
+    client = WebClient(token=token)
+    client.retry_handlers.append(RateLimitErrorRetryHandler(max_retry_count=2))
+    return client
 
 
 def send_message(
@@ -46,15 +68,32 @@ def send_message(
     )
 
 
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def send_message_async(
+    token: str | None,
+    channel: str,
+    text: str,
+    blocks: list[dict] | None = None,
+) -> Future:
+    """Send a message from a background thread and return its Future.
+
+    For notifications whose caller does not need the posted message. Errors
+    surface through the Future. Pending sends still finish at interpreter
+    exit, since executor workers are joined then.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="slack")
+    return _executor.submit(send_message, token, channel, text, blocks)
+
+
 def format_task_notification(task_id: str, title: str, status: str, project: str) -> list[dict]:
     """Format a task notification as Slack blocks."""
-    status_emoji = {
-        "todo": ":white_circle:",
-        "in-progress": ":large_blue_circle:",
-        "done": ":white_check_mark:",
-        "blocked": ":red_circle:",
-    }
-    emoji = status_emoji.get(status, ":grey_question:")
+    emoji = _STATUS_EMOJI.get(status, ":grey_question:")
 
     return [
         {
@@ -86,12 +125,16 @@ def format_pr_review_request(
     ]
 
 
-def format_status_update(project: str, tasks: list[dict]) -> list[dict]:
-    """Format a project status update as Slack blocks."""
+def format_status_update(project: str, tasks: list[dict] | Mapping[str, int]) -> list[dict]:
+    """Format a project status update as Slack blocks.
+
+    Accepts either a list of task dicts or a precomputed status -> count mapping.
+    """
     counts = {"todo": 0, "in-progress": 0, "done": 0, "blocked": 0}
-    for t in tasks:
-        s = t.get("status", "todo")
-        counts[s] = counts.get(s, 0) + 1
+    if isinstance(tasks, Mapping):
+        counts.update(tasks)
+    else:
+        counts.update(Counter(t.get("status", "todo") for t in tasks))
 
     total = sum(counts.values())
     progress = counts["done"] / total * 100 if total > 0 else 0
@@ -26,6 +26,8 @@ class AppContext:
     db: sqlite3.Connection
     config: object
     agent_monitor: AgentMonitor | None = None
+    # Set once the 'default' project is known to exist; projects are never deleted
+    default_project_ready: bool = False
 
 
 @asynccontextmanager
@@ -73,7 +75,9 @@ def create_task(
 ) -> dict:
     """Create a new task. Priority: P0 (highest) to P6 (lowest), default P3."""
     app = _ctx(ctx)
-    projects_mod.ensure_default_project(app.db, str(_cfg(ctx).repo_path))
+    if project == "default" and not app.default_project_ready:
+        projects_mod.ensure_default_project(app.db, str(_cfg(ctx).repo_path))
+        app.default_project_ready = True
     task = tasks_mod.create_task(
         app.db, title, project, description, depends_on=depends_on, priority=priority
     )
@@ -131,13 +135,12 @@ def delete_task(ctx: Context, task_id: str) -> dict:
     app = _ctx(ctx)
     config = _cfg(ctx)
 
-    task = tasks_mod.get_task(app.db, task_id)
+    task = tasks_mod.get_task_with_project(app.db, task_id)
     if not task:
         return {"error": f"Task not found: {task_id}"}
 
     if task.worktree_path:
-        project = projects_mod.get_project(app.db, task.project_id)
-        repo = project.repo_path if project else str(config.repo_path)
+        repo = task.project_repo_path or str(config.repo_path)
         worktrees_mod.remove_worktree_for_task(app.db, task_id, repo, force=True)
 
     tasks_mod.delete_task(app.db, task_id)
@@ -210,14 +213,13 @@ def create_worktree(
     """Create a git worktree for a task. Returns the worktree path and branch."""
     app = _ctx(ctx)
     config = _cfg(ctx)
-    task = tasks_mod.get_task(app.db, task_id)
+    task = tasks_mod.get_task_with_project(app.db, task_id)
     if not task:
         return {"error": f"Task not found: {task_id}"}
-    project = projects_mod.get_project(app.db, task.project_id)
-    if not project:
+    if not task.project_repo_path:
         return {"error": f"Project not found for task '{task_id}' — cannot determine repo path"}
     return worktrees_mod.create_worktree_for_task(
-        app.db, task_id, project.repo_path, base_branch=base_branch, branch_name=branch_name
+        app.db, task_id, task.project_repo_path, base_branch=base_branch, branch_name=branch_name
     )
 
 
@@ -234,11 +236,10 @@ def remove_worktree(ctx: Context, task_id: str, force: bool = False) -> dict:
     """Remove the git worktree for a task."""
     app = _ctx(ctx)
     config = _cfg(ctx)
-    task = tasks_mod.get_task(app.db, task_id)
+    task = tasks_mod.get_task_with_project(app.db, task_id)
     if not task:
         return {"error": f"Task not found: {task_id}"}
-    project = projects_mod.get_project(app.db, task.project_id)
-    repo = project.repo_path if project else str(config.repo_path)
+    repo = task.project_repo_path or str(config.repo_path)
     return worktrees_mod.remove_worktree_for_task(app.db, task_id, repo, force=force)
 
 
@@ -324,9 +325,8 @@ def post_status_update(
     if not channel:
         return {"error": "No channel specified and no default channel for project"}
 
-    tasks = tasks_mod.list_tasks(app.db, project)
-    task_dicts = [{"status": t.status} for t in tasks]
-    blocks = slack_mod.format_status_update(project, task_dicts)
+    counts = tasks_mod.status_counts(app.db, project)
+    blocks = slack_mod.format_status_update(project, counts)
     try:
         result = slack_mod.send_message(
             config.slack_bot_token, channel, f"Status update: {project}", blocks
@@ -19,65 +19,57 @@ from work_orchestrator.core import planner as planner_mod
 from work_orchestrator.core import projects as projects_mod
 from work_orchestrator.core import tasks as tasks_mod
 from work_orchestrator.core import worktrees as worktrees_mod
-from work_orchestrator.db.engine import init_db
+from work_orchestrator.db.pool import get_pool
 
 
 # Path to the built frontend
 FRONTEND_DIST = Path(__file__).resolve().parent.parent.parent.parent / "frontend" / "dist"
 
 
-def _get_db():
-    config = get_config()
-    return init_db(config.db_path)
+def _get_db(readonly=False):
+    """Check out a connection from the process-wide pool for the configured DB.
+
+    The server is long-lived, so handlers reuse pooled connections instead of
+    opening (and re-running PRAGMAs and migrations on) a new one per request.
+    """
+    pool = get_pool(get_config().db_path)
+    return pool.get_reader() if readonly else pool.get_writer()
 
 
 # ── Handlers ──────────────────────────────────────────────────────────────────
 
 
 async def api_list_projects(request: Request):
-    db = _get_db()
-    try:
+    with _get_db(readonly=True) as db:
         projects = projects_mod.list_projects(db)
         return JSONResponse([_project_dict(p) for p in projects])
-    finally:
-        db.close()
 
 
 async def api_get_project(request: Request):
     project_id = request.path_params["project_id"]
-    db = _get_db()
-    try:
+    with _get_db(readonly=True) as db:
         project = projects_mod.get_project(db, project_id)
         if not project:
             return JSONResponse({"error": "Project not found"}, status_code=404)
         return JSONResponse(_project_dict(project))
-    finally:
-        db.close()
 
 
 async def api_project_tasks(request: Request):
     project_id = request.path_params["project_id"]
     status_filter = request.query_params.get("status")
-    db = _get_db()
-    try:
+    with _get_db(readonly=True) as db:
         top_level = tasks_mod.list_tasks(db, project_id, status=status_filter)
-        result = []
-        for task in top_level:
-            td = _full_task_dict(db, task)
-            result.append(td)
-        return JSONResponse(result)
-    finally:
-        db.close()
+        subtasks = tasks_mod.list_subtasks_by_parents(db, project_id, [t.id for t in top_level])
+        return JSONResponse([_full_task_dict(t, subtasks.get(t.id)) for t in top_level])
 
 
 async def api_project_summary(request: Request):
     project_id = request.path_params["project_id"]
-    db = _get_db()
-    try:
+    with _get_db(readonly=True) as db:
         all_top = tasks_mod.list_tasks(db, project_id)
         all_tasks = list(all_top)
-        for t in all_top:
-            subs = tasks_mod.list_tasks(db, project_id, parent_task_id=t.id)
+        subtasks = tasks_mod.list_subtasks_by_parents(db, project_id, [t.id for t in all_top])
+        for subs in subtasks.values():
             all_tasks.extend(subs)
 
         counts = {"todo": 0, "in-progress": 0, "done": 0, "blocked": 0, "review": 0}
@@ -92,14 +84,11 @@ async def api_project_summary(request: Request):
             "total": total,
             "progress_pct": round(progress, 1),
         })
-    finally:
-        db.close()
 
 
 async def api_get_task(request: Request):
     task_id = request.path_params["task_id"]
-    db = _get_db()
-    try:
+    with _get_db(readonly=True) as db:
         task = tasks_mod.get_task(db, task_id)
         if not task:
             return JSONResponse({"error": "Task not found"}, status_code=404)
@@ -108,20 +97,16 @@ async def api_get_task(request: Request):
         if task.subtasks:
             td["subtasks"] = [_task_dict(s) for s in task.subtasks]
         return JSONResponse(td)
-    finally:
-        db.close()
 
 
 async def api_list_worktrees(request: Request):
     config = get_config()
-    db = _get_db()
-    try:
-        wts = worktrees_mod.list_task_worktrees(db, str(config.repo_path))
-        return JSONResponse(wts)
-    except Exception:
-        return JSONResponse([])
-    finally:
-        db.close()
+    with _get_db(readonly=True) as db:
+        try:
+            wts = worktrees_mod.list_task_worktrees(db, str(config.repo_path))
+            return JSONResponse(wts)
+        except Exception:
+            return JSONResponse([])
 
 
 async def api_dispatch_task(request: Request):
@@ -133,29 +118,27 @@ async def api_dispatch_task(request: Request):
     max_turns = body.get("max_turns")
 
     config = get_config()
-    db = _get_db()
-    try:
-        task = tasks_mod.get_task(db, task_id)
-        if not task:
-            return JSONResponse({"error": "Task not found"}, status_code=404)
-
-        output_dir = str(Path(config.agent_output_dir).resolve())
-
-        run = agents_mod.delegate_task(
-            db,
-            task_id=task_id,
-            instructions=f"Complete the task: {task.title}",
-            output_dir=output_dir,
-            project_id=task.project_id,
-            model=model or config.agent_default_model,
-            max_turns=max_turns or config.agent_default_max_turns,
-            backend=backend or config.default_backend,
-        )
-        return JSONResponse(_agent_run_dict(run))
-    except ValueError as e:
-        return JSONResponse({"error": str(e)}, status_code=400)
-    finally:
-        db.close()
+    with _get_db() as db:
+        try:
+            task = tasks_mod.get_task(db, task_id)
+            if not task:
+                return JSONResponse({"error": "Task not found"}, status_code=404)
+
+            output_dir = str(Path(config.agent_output_dir).resolve())
+
+            run = agents_mod.delegate_task(
+                db,
+                task_id=task_id,
+                instructions=f"Complete the task: {task.title}",
+                output_dir=output_dir,
+                project_id=task.project_id,
+                model=model or config.agent_default_model,
+                max_turns=max_turns or config.agent_default_max_turns,
+                backend=backend or config.default_backend,
+            )
+            return JSONResponse(_agent_run_dict(run))
+        except ValueError as e:
+            return JSONResponse({"error": str(e)}, status_code=400)
 
 
 # ── Serialization ─────────────────────────────────────────────────────────────
@@ -191,10 +174,9 @@ def _task_dict(t) -> dict:
     }
 
 
-def _full_task_dict(db, task) -> dict:
+def _full_task_dict(task, subs) -> dict:
     """Task dict with subtasks nested."""
     td = _task_dict(task)
-    subs = tasks_mod.list_tasks(db, task.project_id, parent_task_id=task.id)
     if subs:
         td["subtasks"] = [_task_dict(s) for s in subs]
     return td
@@ -217,20 +199,16 @@ async def api_plan_start(request: Request):
     body = await request.json()
     title = body.get("title", "New chat")
     project_id = body.get("project_id")
-    db = _get_db()
-    try:
+    with _get_db() as db:
         session = planner_mod.create_session(db, title, project_id=project_id)
         return JSONResponse(_session_dict(session))
-    finally:
-        db.close()
 
 
 async def api_plan_update(request: Request):
     """Update session metadata (title, project_id)."""
     session_id = request.path_params["session_id"]
     body = await request.json()
-    db = _get_db()
-    try:
+    with _get_db() as db:
         session = planner_mod.get_session(db, session_id)
         if not session:
             return JSONResponse({"error": "Session not found"}, status_code=404)
@@ -240,24 +218,18 @@ async def api_plan_update(request: Request):
             planner_mod.update_session_project(db, session_id, body["project_id"])
         session = planner_mod.get_session(db, session_id)
         return JSONResponse(_session_dict(session))
-    finally:
-        db.close()
 
 
 async def api_plan_sessions(request: Request):
     project_id = request.query_params.get("project_id")
-    db = _get_db()
-    try:
+    with _get_db(readonly=True) as db:
         sessions = planner_mod.list_sessions(db, project_id=project_id)
         return JSONResponse([_session_dict(s) for s in sessions])
-    finally:
-        db.close()
 
 
 async def api_plan_detail(request: Request):
     session_id = request.path_params["session_id"]
-    db = _get_db()
-    try:
+    with _get_db(readonly=True) as db:
         session = planner_mod.get_session(db, session_id)
         if not session:
             return JSONResponse({"error": "Session not found"}, status_code=404)
@@ -270,8 +242,6 @@ async def api_plan_detail(request: Request):
         if session.prd_content:
             result["prd_content"] = session.prd_content
         return JSONResponse(result)
-    finally:
-        db.close()
 
 
 # ── Agent Handlers ───────────────────────────────────────────────────────────
@@ -280,23 +250,17 @@ async def api_plan_detail(request: Request):
 async def api_list_agents(request: Request):
     status_filter = request.query_params.get("status")
     project_filter = request.query_params.get("project")
-    db = _get_db()
-    try:
+    with _get_db(readonly=True) as db:
         runs = agents_mod.list_agent_runs(db, status=status_filter, project_id=project_filter)
         return JSONResponse([_agent_run_dict(r) for r in runs])
-    finally:
-        db.close()
 
 
 async def api_list_slots(request: Request):
     project_id = request.path_params["project_id"]
     status_filter = request.query_params.get("status")
-    db = _get_db()
-    try:
+    with _get_db(readonly=True) as db:
         slots = agents_mod.list_worktree_slots(db, project_id, status=status_filter)
         return JSONResponse([_slot_dict(s) for s in slots])
-    finally:
-        db.close()
 
 
 def _session_dict(s) -> dict:
@@ -1,8 +1,11 @@
 """Tests for agent orchestration."""
 
 import os
+import select
+import sqlite3
 import subprocess
 import tempfile
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -86,6 +89,16 @@ class TestWorktreeSlots:
         slots2 = agents_mod.discover_and_register_worktrees(db, "test", repo_path)
         assert len(slots2) == 0  # No new ones
 
+    def test_discover_matches_unresolved_stored_path(self, db, git_repo):
+        repo_path, _ = git_repo
+        db.execute(
+            "INSERT INTO worktree_slots (project_id, path, label) VALUES (?, ?, ?)",
+            ("test", f"{repo_path}/.", "main"),
+        )
+        db.commit()
+        slots = agents_mod.discover_and_register_worktrees(db, "test", repo_path)
+        assert len(slots) == 2
+
     def test_list_slots(self, db, git_repo):
         repo_path, _ = git_repo
         agents_mod.discover_and_register_worktrees(db, "test", repo_path)
@@ -140,6 +153,16 @@ class TestWorktreeSlots:
         assert slot.branch == "feature-branch"
         assert slot.status == "available"
 
+    def test_register_slot_stores_resolved_path(self, db, git_repo):
+        repo_path, _ = git_repo
+        slot = agents_mod.register_worktree_slot(
+            db, "test", f"{repo_path}/../repo", "repo"
+        )
+        assert slot.path == str(Path(repo_path).resolve())
+        assert agents_mod.discover_and_register_worktrees(db, "test", repo_path) != []
+        labels = [s.label for s in agents_mod.list_worktree_slots(db, "test")]
+        assert labels.count("repo") == 1
+
 
 class TestPromptBuilder:
     def test_build_prompt(self, db, git_repo):
@@ -155,6 +178,20 @@ class TestPromptBuilder:
         prompt = agents_mod.build_agent_prompt(db, "fix-bug", "Fix the bug")
         assert "Test Project" in prompt
 
+    def test_build_prompt_lists_dependencies(self, db, git_repo):
+        tasks_mod.create_task(db, "Schema", "test")
+        tasks_mod.create_task(db, "Migrate", "test", depends_on=["schema"])
+        prompt = agents_mod.build_agent_prompt(db, "migrate", "Go")
+        assert "- Schema (schema): todo" in prompt
+
+    def test_build_prompt_with_prefetched_task(self, db, git_repo):
+        task = tasks_mod.create_task(db, "Fix bug", "test")
+        project = projects_mod.get_project(db, "test")
+        prompt = agents_mod.build_agent_prompt(
+            db, task.id, "Fix the bug", task=task, project=project
+        )
+        assert "Test Project" in prompt
+
     def test_build_prompt_nonexistent_task(self, db, git_repo):
         with pytest.raises(ValueError, match="Task not found"):
             agents_mod.build_agent_prompt(db, "nope", "instructions")
@@ -185,6 +222,12 @@ class TestAgentLaunch:
         assert run.model == "sonnet"
         mock_popen.assert_called_once()
 
+        # The prompt goes to the agent on stdin, not in argv
+        cmd = mock_popen.call_args.args[0]
+        assert not any("Do the thing" in arg for arg in cmd)
+        prompt_path = Path(mock_popen.call_args.kwargs["stdin"].name)
+        assert "Do the thing" in prompt_path.read_text()
+
         # Task should be moved to in-progress
         updated = tasks_mod.get_task(db, task.id)
         assert updated.status == "in-progress"
@@ -245,15 +288,68 @@ class TestAgentCancel:
             terminal=False,
         )
 
-        with patch("os.kill") as mock_kill:
+        assert mock_popen.call_args.kwargs["start_new_session"] is True
+
+        with patch("os.getpgid", return_value=99999), patch("os.killpg") as mock_killpg:
             cancelled = agents_mod.cancel_agent(db, task.id)
             assert cancelled.status == "cancelled"
-            mock_kill.assert_called_once_with(99999, 15)  # SIGTERM
+            mock_killpg.assert_called_once_with(99999, 15)  # SIGTERM to the group
 
         # Slot should be released
         slot = agents_mod.get_worktree_slot(db, slots[0].id)
         assert slot.status == "available"
 
+    def test_cancel_kills_child_processes(self, db_with_slots, git_repo):
+        db = db_with_slots
+        slots = agents_mod.list_worktree_slots(db, "test")
+        task = tasks_mod.create_task(db, "Tree test", "test")
+        agents_mod.assign_task_to_slot(db, task.id, slots[0].id)
+
+        # A shell standing in for the agent, with a child like a tool
+        # subprocess; both hold the stdout pipe open until they exit
+        proc = subprocess.Popen(
+            ["sh", "-c", "sleep 30 & echo started; wait"],
+            stdout=subprocess.PIPE, text=True, start_new_session=True,
+        )
+        assert proc.stdout.readline() == "started\n"
+        db.execute(
+            "INSERT INTO agent_runs (task_id, worktree_slot_id, pid, status, instructions) "
+            "VALUES (?, ?, ?, 'running', 'Work')",
+            (task.id, slots[0].id, proc.pid),
+        )
+        db.commit()
+
+        agents_mod.cancel_agent(db, task.id)
+        proc.wait(timeout=5)
+        readable, _, _ = select.select([proc.stdout], [], [], 5)
+        assert readable and proc.stdout.read() == ""  # EOF: the child is gone too
+
+    @patch("work_orchestrator.core.agents.subprocess.Popen")
+    def test_completion_does_not_override_cancel(self, mock_popen, db_with_slots, git_repo):
+        _, tmp = git_repo
+        db = db_with_slots
+        slots = agents_mod.list_worktree_slots(db, "test")
+        task = tasks_mod.create_task(db, "Race test", "test")
+        agents_mod.assign_task_to_slot(db, task.id, slots[0].id)
+
+        mock_proc = MagicMock()
+        mock_proc.pid = 66666
+        mock_popen.return_value = mock_proc
+        run = agents_mod.launch_agent(
+            db, task.id, "Work",
+            output_dir=str(Path(tmp) / "outputs"),
+            terminal=False,
+        )
+
+        # The monitor read the run as running, then the user cancelled it
+        with patch("os.getpgid", return_value=66666), patch("os.killpg"):
+            agents_mod.cancel_agent(db, task.id)
+        monitor = agents_mod.AgentMonitor(Path(tmp) / "test.db")
+        monitor._handle_completion(db, run, exit_code=0)
+
+        assert agents_mod.get_agent_run(db, run.id).status == "cancelled"
+        assert tasks_mod.get_task(db, task.id).status == "in-progress"
+
     def test_cancel_nonexistent(self, db, git_repo):
         result = agents_mod.cancel_agent(db, "nope")
         assert result is None
@@ -443,3 +539,152 @@ class TestReviewStatus:
         task = tasks_mod.create_task(db, "Review me", "test")
         updated = tasks_mod.update_task_status(db, task.id, "review")
         assert updated.status == "review"
+
+
+class TestAgentMonitor:
+    @patch("work_orchestrator.core.agents.subprocess.Popen")
+    def test_monitor_completes_finished_run(self, mock_popen, db_with_slots, git_repo):
+        _, tmp = git_repo
+        db = db_with_slots
+        slots = agents_mod.list_worktree_slots(db, "test")
+        task = tasks_mod.create_task(db, "Monitor test", "test")
+        agents_mod.assign_task_to_slot(db, task.id, slots[0].id)
+
+        mock_proc = MagicMock()
+        mock_proc.pid = 88888
+        mock_proc.poll.return_value = 0
+        mock_popen.return_value = mock_proc
+
+        agents_mod.launch_agent(
+            db, task.id, "Work",
+            output_dir=str(Path(tmp) / "outputs"),
+            terminal=False,
+        )
+
+        monitor = agents_mod.AgentMonitor(Path(tmp) / "test.db", poll_interval=60)
+        monitor.start()
+        monitor.stop()
+        assert monitor._db is None and monitor._reader is None
+
+        run = agents_mod.get_latest_agent_run(db, task.id)
+        assert run.status == "completed"
+        assert tasks_mod.get_task(db, task.id).status == "review"
+
+    @patch("work_orchestrator.core.agents.subprocess.Popen")
+    def test_monitor_handles_exit_without_scan(self, mock_popen, db_with_slots, git_repo):
+        _, tmp = git_repo
+        db = db_with_slots
+        slots = agents_mod.list_worktree_slots(db, "test")
+        task = tasks_mod.create_task(db, "Reaper test", "test")
+        agents_mod.assign_task_to_slot(db, task.id, slots[0].id)
+
+        mock_proc = MagicMock()
+        mock_proc.pid = 99999
+        mock_proc.poll.return_value = 0
+        mock_popen.return_value = mock_proc
+
+        monitor = agents_mod.AgentMonitor(Path(tmp) / "test.db", poll_interval=60)
+        with patch.object(monitor, "_check_agents") as check:
+            monitor.start()
+            try:
+                agents_mod.launch_agent(
+                    db, task.id, "Work",
+                    output_dir=str(Path(tmp) / "outputs"),
+                    terminal=False,
+                )
+                # The reaper may fire before the run row exists; re-queue it
+                agents_mod._exited_pids.put(99999)
+                for _ in range(50):
+                    run = agents_mod.get_latest_agent_run(db, task.id)
+                    if run.status != "running":
+                        break
+                    time.sleep(0.1)
+            finally:
+                monitor.stop()
+        assert run.status == "completed"
+        assert check.call_count == 1  # Only the startup scan
+
+    def test_monitor_scans_while_exits_keep_arriving(self, db, git_repo):
+        _, tmp = git_repo
+        monitor = agents_mod.AgentMonitor(Path(tmp) / "test.db", poll_interval=0.2)
+        with patch.object(monitor, "_check_agents") as check:
+            monitor.start()
+            try:
+                # A steady stream of exits must not starve the periodic scan
+                for _ in range(20):
+                    agents_mod._exited_pids.put(-1)
+                    time.sleep(0.05)
+            finally:
+                monitor.stop()
+        assert check.call_count >= 3
+
+    def test_monitor_polls_read_only(self, db, git_repo):
+        _, tmp = git_repo
+        monitor = agents_mod.AgentMonitor(Path(tmp) / "test.db", poll_interval=60)
+        monitor.start()
+        try:
+            with pytest.raises(sqlite3.OperationalError):
+                monitor._reader.execute("DELETE FROM agent_runs")
+        finally:
+            monitor.stop()
+
+
+class TestTerminalLaunch:
+    def test_reads_pid_from_launcher(self, git_repo):
+        _, tmp = git_repo
+        out_path = Path(tmp) / "outputs"
+        out_path.mkdir()
+        pid_file = out_path / "agent-t1-ts.pid"
+
+        def fake_osascript(*args, **kwargs):
+            # Stands in for the launcher script's `echo $$ > pid_file`
+            with open(pid_file, "w") as f:
+                f.write("4242\n")
+
+        with patch("work_orchestrator.core.agents.subprocess.Popen", side_effect=fake_osascript):
+            pid = agents_mod._launch_in_terminal(
+                "true", tmp, str(out_path / "out.json"), "t1", out_path, "ts"
+            )
+        assert pid == 4242
+        assert not pid_file.exists()
+
+    def test_returns_zero_when_launcher_never_reports(self, git_repo):
+        _, tmp = git_repo
+        out_path = Path(tmp) / "outputs"
+        out_path.mkdir()
+        with patch("work_orchestrator.core.agents.subprocess.Popen"), \
+                patch("work_orchestrator.core.agents.select.select", return_value=([], [], [])):
+            pid = agents_mod._launch_in_terminal(
+                "true", tmp, str(out_path / "out.json"), "t1", out_path, "ts"
+            )
+        assert pid == 0
+
+    def test_timeout_leaves_no_readerless_fifo(self, git_repo):
+        _, tmp = git_repo
+        out_path = Path(tmp) / "outputs"
+        out_path.mkdir()
+        pid_file = out_path / "agent-t1-ts.pid"
+        real_close = os.close
+        fifo_present_at_close = []
+
+        def tracking_close(fd):
+            fifo_present_at_close.append(pid_file.exists())
+            real_close(fd)
+
+        with patch("work_orchestrator.core.agents.subprocess.Popen"), \
+                patch("work_orchestrator.core.agents.select.select", return_value=([], [], [])), \
+                patch("work_orchestrator.core.agents.os.close", side_effect=tracking_close):
+            pid = agents_mod._launch_in_terminal(
+                "true", tmp, str(out_path / "out.json"), "t1", out_path, "ts"
+            )
+        assert pid == 0
+        assert fifo_present_at_close == [False, False]
+
+        # A launcher that starts late still runs to completion (its final
+        # `read` hits EOF, so the exit status itself is not meaningful)
+        script = out_path / "agent-t1-ts.sh"
+        result = subprocess.run(
+            ["bash", str(script)], stdin=subprocess.DEVNULL, capture_output=True,
+            timeout=10, check=False,
+        )
+        assert b"Agent finished (exit code: 0)" in result.stdout
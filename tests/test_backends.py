@@ -2,6 +2,7 @@
 
 import tempfile
 import json
+import subprocess
 from pathlib import Path
 
 import pytest
@@ -89,6 +90,14 @@ class TestClaudeCodeBackend:
         assert "--mcp-config" in cmd
         assert "/path/.mcp.json" in cmd
 
+    def test_build_command_with_prompt_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            prompt_file = Path(tmp) / "prompt.md"
+            cmd = self.backend.build_command("Do stuff", prompt_file=str(prompt_file))
+            assert prompt_file.read_text() == "Do stuff"
+        assert "Do stuff" not in cmd
+        assert cmd[:3] == ["claude", "-p", "-"]
+
     def test_build_terminal_command(self):
         result = self.backend.build_terminal_command("hello world")
         assert "claude" in result
@@ -156,6 +165,17 @@ class TestOpenCodeBackend:
         assert "opencode" in result
         assert "run" in result
 
+    def test_build_terminal_command_with_prompt_file(self):
+        prompt = "it's $HOME and `date`"
+        with tempfile.TemporaryDirectory() as tmp:
+            prompt_file = str(Path(tmp) / "prompt.md")
+            result = self.backend.build_terminal_command(prompt, prompt_file=prompt_file)
+            assert prompt not in result
+            # Swap the binary for printf to see the argument bash passes it
+            script = result.replace("opencode run", "printf %s", 1)
+            out = subprocess.run(["bash", "-c", script], capture_output=True, text=True, check=True)
+        assert out.stdout == prompt
+
 
 class TestPiAgentBackend:
     def setup_method(self):
@@ -1,14 +1,17 @@
 """Tests for the CLI."""
 
+import json
 import os
 import subprocess
+import sys
 import tempfile
 from pathlib import Path
 
+import click
 import pytest
 from click.testing import CliRunner
 
-from work_orchestrator.cli import main
+from work_orchestrator.cli import _COMMANDS, main
 from work_orchestrator.db.engine import init_db
 from work_orchestrator.core import projects as projects_mod
 
@@ -121,3 +124,77 @@ class TestCLI:
         result = runner.invoke(main, ["task", "done", "done-task"])
         assert result.exit_code == 0
         assert "Completed" in result.output
+
+    def test_task_list_json(self, cli_env):
+        runner, repo_path = cli_env
+
+        runner.invoke(main, ["init", "json-test", "--repo-path", repo_path])
+        runner.invoke(main, ["task", "add", "First task", "--project", "json-test", "-p", "1"])
+        runner.invoke(main, ["task", "add", "Second task", "--project", "json-test",
+                             "--depends-on", "first-task"])
+
+        result = runner.invoke(main, ["task", "list", "--project", "json-test", "--json"])
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert [t["id"] for t in data] == ["first-task", "second-task"]
+        assert data[0]["priority"] == "P1"
+        assert data[0]["project"] == "json-test"
+        assert data[1]["depends_on"] == ["first-task"]
+
+    def test_task_list_out_of_range_priority(self, cli_env):
+        runner, repo_path = cli_env
+
+        runner.invoke(main, ["init", "prio-test", "--repo-path", repo_path])
+        runner.invoke(main, ["task", "add", "Odd task", "--project", "prio-test"])
+        db = init_db(Path(os.environ["WO_DB_PATH"]))
+        db.execute("UPDATE tasks SET priority = 9 WHERE id = 'odd-task'")
+        db.commit()
+        db.close()
+
+        result = runner.invoke(main, ["task", "list", "--project", "prio-test"])
+        assert result.exit_code == 0
+        assert "P9 odd-task" in result.output
+        result = runner.invoke(main, ["task", "list", "--project", "prio-test", "--json"])
+        assert json.loads(result.output)[0]["priority"] == "P9"
+
+    def test_task_add_depends_on_ignores_empty_entries(self, cli_env):
+        runner, repo_path = cli_env
+
+        runner.invoke(main, ["init", "dep-test", "--repo-path", repo_path])
+        runner.invoke(main, ["task", "add", "Base task", "--project", "dep-test"])
+
+        result = runner.invoke(main, ["task", "add", "Next task", "--project", "dep-test",
+                                      "--depends-on", " base-task ,"])
+        assert result.exit_code == 0
+        assert "Depends on: base-task" in result.output
+
+    def test_commands_load_lazily(self, cli_env):
+        script = (
+            "import sys\n"
+            "from work_orchestrator.cli import main\n"
+            "main(['task', 'list'], standalone_mode=False)\n"
+            "print(sorted(m for m in sys.modules if m.startswith('work_orchestrator.commands.')))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+        assert result.stdout.splitlines()[-1] == "['work_orchestrator.commands.task']"
+
+    def test_help_lists_lazy_commands(self, cli_env):
+        runner, _ = cli_env
+        result = runner.invoke(main, ["--help"])
+        for name in ("agent", "mcp", "plan", "task", "ui", "worktree"):
+            assert f"  {name} " in result.output
+
+    def test_help_does_not_import_commands(self, cli_env):
+        script = (
+            "import sys\n"
+            "from work_orchestrator.cli import main\n"
+            "main(['--help'], standalone_mode=False)\n"
+            "print([m for m in sys.modules if m.startswith('work_orchestrator.commands.')])\n"
+        )
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+        assert result.stdout.splitlines()[-1] == "[]"
+
+    def test_registry_help_matches_commands(self, cli_env):
+        ctx = click.Context(main)
+        for name, (_, short_help) in _COMMANDS.items():
+            assert main.get_command(ctx, name).get_short_help_str(200) == short_help
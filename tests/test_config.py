@@ -0,0 +1,38 @@
+"""Tests for configuration loading."""
+
+from pathlib import Path
+
+from work_orchestrator.config import get_config
+
+
+class TestGetConfig:
+    def test_reads_env(self, monkeypatch):
+        monkeypatch.setenv("WO_DB_PATH", "/tmp/wo-config-test.db")
+        monkeypatch.setenv("WO_AGENT_DEFAULT_MAX_TURNS", "7")
+        config = get_config()
+        assert config.db_path == Path("/tmp/wo-config-test.db")
+        assert config.agent_default_max_turns == 7
+
+    def test_cached_while_env_unchanged(self, monkeypatch):
+        monkeypatch.setenv("WO_DB_PATH", "/tmp/wo-config-test.db")
+        assert get_config() is get_config()
+
+    def test_env_change_reloads(self, monkeypatch):
+        monkeypatch.setenv("WO_DB_PATH", "/tmp/wo-a.db")
+        first = get_config()
+        monkeypatch.setenv("WO_DB_PATH", "/tmp/wo-b.db")
+        second = get_config()
+        assert first.db_path == Path("/tmp/wo-a.db")
+        assert second.db_path == Path("/tmp/wo-b.db")
+
+    def test_cwd_change_reloads_repo_default(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("WO_REPO_PATH", raising=False)
+        monkeypatch.chdir(tmp_path)
+        assert get_config().repo_path == tmp_path
+
+    def test_repo_path_env_ignores_cwd(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("WO_REPO_PATH", "/tmp/wo-repo")
+        first = get_config()
+        monkeypatch.chdir(tmp_path)
+        assert get_config() is first
+        assert first.repo_path == Path("/tmp/wo-repo")
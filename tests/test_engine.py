@@ -0,0 +1,86 @@
+"""Tests for database initialization and migrations."""
+
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from work_orchestrator.db import engine
+
+
+@pytest.fixture
+def db_path():
+    """Path to a database file in a temporary directory."""
+    with tempfile.TemporaryDirectory() as tmp:
+        yield Path(tmp) / "test.db"
+
+
+def _create_legacy_db(path: Path):
+    """Create a database with the CHECK constraints from before 'review' and 'draining'."""
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        engine.SCHEMA.replace(", 'review')", ")").replace(", 'draining')", ")")
+    )
+    conn.execute("INSERT INTO projects (id, name, repo_path) VALUES ('p', 'P', '/tmp')")
+    conn.execute("INSERT INTO tasks (id, project_id, title) VALUES ('a', 'p', 'A')")
+    conn.execute(
+        "INSERT INTO tasks (id, project_id, title, parent_task_id) VALUES ('b', 'p', 'B', 'a')"
+    )
+    conn.execute("INSERT INTO task_dependencies VALUES ('b', 'a')")
+    conn.commit()
+    conn.close()
+
+
+class TestMigrations:
+    def test_new_database_is_at_current_version(self, db_path):
+        conn = engine.init_db(db_path)
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == engine.SCHEMA_VERSION
+        conn.close()
+
+    def test_rebuild_widens_check_constraints(self, db_path):
+        _create_legacy_db(db_path)
+        conn = engine.init_db(db_path)
+        conn.execute("UPDATE tasks SET status = 'review' WHERE id = 'a'")
+        conn.execute(
+            "INSERT INTO worktree_slots (project_id, path, label, status) VALUES ('p', '/w', 'w', 'draining')"
+        )
+        conn.commit()
+        rows = conn.execute("SELECT id, parent_task_id FROM tasks ORDER BY id").fetchall()
+        assert [tuple(r) for r in rows] == [("a", None), ("b", "a")]
+        indexes = {
+            r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE tbl_name = 'tasks'")
+        }
+        assert {"idx_tasks_list", "idx_tasks_parent"} <= indexes
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        conn.close()
+
+    def test_rebuild_keeps_references(self, db_path):
+        _create_legacy_db(db_path)
+        conn = engine.init_db(db_path)
+        conn.execute("DELETE FROM tasks WHERE id = 'b'")
+        conn.commit()
+        # ON DELETE CASCADE still reaches task_dependencies
+        assert conn.execute("SELECT COUNT(*) FROM task_dependencies").fetchone()[0] == 0
+        conn.close()
+
+    def test_migrates_table_without_priority(self, db_path):
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE projects (id TEXT PRIMARY KEY, name TEXT, repo_path TEXT)")
+        conn.execute(
+            """CREATE TABLE tasks (
+                   id TEXT PRIMARY KEY, project_id TEXT, title TEXT, parent_task_id TEXT,
+                   status TEXT DEFAULT 'todo', worktree_path TEXT,
+                   created_at TEXT DEFAULT (datetime('now'))
+               )"""
+        )
+        conn.execute("INSERT INTO tasks (id, project_id, title) VALUES ('a', 'p', 'A')")
+        conn.commit()
+        conn.close()
+        conn = engine.init_db(db_path)
+        assert conn.execute("SELECT priority FROM tasks WHERE id = 'a'").fetchone()[0] == 3
+        indexes = {
+            r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE tbl_name = 'tasks'")
+        }
+        assert {"idx_tasks_list", "idx_tasks_parent"} <= indexes
+        conn.close()
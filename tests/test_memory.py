@@ -0,0 +1,62 @@
+"""Tests for the persistent memory store."""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from work_orchestrator.core import memory as memory_mod
+from work_orchestrator.core import projects as projects_mod
+from work_orchestrator.db.engine import init_db
+
+
+@pytest.fixture
+def db():
+    """Create a temporary SQLite database for testing."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "test.db"
+        conn = init_db(db_path)
+        projects_mod.create_project(conn, "test", "Test Project", tmp)
+        yield conn
+        conn.close()
+
+
+class TestRemember:
+    def test_remember_and_recall(self, db):
+        mem = memory_mod.remember(db, "style", "black", project_id="test")
+        assert mem.value == "black"
+        assert memory_mod.recall_by_key(db, "style", "test").id == mem.id
+
+    def test_remember_updates_existing(self, db):
+        first = memory_mod.remember(db, "style", "black", project_id="test")
+        second = memory_mod.remember(db, "style", "ruff", "tooling", project_id="test")
+        assert second.id == first.id
+        assert (second.value, second.category) == ("ruff", "tooling")
+        assert len(memory_mod.list_memories(db, project_id="test")) == 1
+
+    def test_remember_updates_global_memory(self, db):
+        first = memory_mod.remember(db, "editor", "vim")
+        second = memory_mod.remember(db, "editor", "helix")
+        assert second.id == first.id
+        assert len(memory_mod.list_memories(db)) == 1
+        assert memory_mod.search_memories(db, "helix")[0].id == first.id
+
+    def test_global_and_project_memories_are_separate(self, db):
+        memory_mod.remember(db, "editor", "vim")
+        memory_mod.remember(db, "editor", "emacs", project_id="test")
+        assert memory_mod.recall_by_key(db, "editor").value == "vim"
+        assert memory_mod.recall_by_key(db, "editor", "test").value == "emacs"
+
+
+class TestSearchMemories:
+    def test_search_includes_global_memories(self, db):
+        memory_mod.remember(db, "db", "sqlite everywhere")
+        memory_mod.remember(db, "orm", "sqlite via raw sql", project_id="test")
+        keys = {m.key for m in memory_mod.search_memories(db, "sqlite", project_id="test")}
+        assert keys == {"db", "orm"}
+
+    def test_search_limit(self, db):
+        for i in range(8):
+            memory_mod.remember(db, f"note-{i}", "deploy checklist")
+        assert len(memory_mod.search_memories(db, "deploy", limit=5)) == 5
+        assert len(memory_mod.search_memories(db, "deploy")) == 8
@@ -0,0 +1,76 @@
+"""Tests for the SQLite connection pool."""
+
+import sqlite3
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from work_orchestrator.core import projects as projects_mod
+from work_orchestrator.db.pool import ConnectionPool
+
+
+@pytest.fixture
+def pool():
+    """Create a pool over a temporary database."""
+    with tempfile.TemporaryDirectory() as tmp:
+        p = ConnectionPool(Path(tmp) / "test.db", max_readers=2)
+        yield p
+        p.close()
+
+
+class TestConnectionPool:
+    def test_reader_sees_committed_writes(self, pool):
+        with pool.get_writer() as db:
+            projects_mod.create_project(db, "p1", "Project 1", "/tmp")
+        with pool.get_reader() as db:
+            assert projects_mod.get_project(db, "p1").name == "Project 1"
+
+    def test_reader_is_read_only(self, pool):
+        with pool.get_reader() as db, pytest.raises(sqlite3.OperationalError):
+            db.execute("INSERT INTO projects (id, name, repo_path) VALUES ('x', 'x', '/tmp')")
+
+    def test_readers_are_reused(self, pool):
+        with pool.get_reader() as first:
+            pass
+        with pool.get_reader() as second:
+            assert second is first
+
+    def test_concurrent_readers_get_distinct_connections(self, pool):
+        with pool.get_reader() as a, pool.get_reader() as b:
+            assert a is not b
+
+    def test_writer_rolls_back_on_error(self, pool):
+        with pytest.raises(RuntimeError), pool.get_writer() as db:
+            db.execute("INSERT INTO projects (id, name, repo_path) VALUES ('x', 'x', '/tmp')")
+            raise RuntimeError("boom")
+        with pool.get_reader() as db:
+            assert projects_mod.get_project(db, "x") is None
+
+    def test_readers_usable_from_other_threads(self, pool):
+        with pool.get_writer() as db:
+            projects_mod.create_project(db, "p1", "Project 1", "/tmp")
+        names = []
+
+        def read():
+            with pool.get_reader() as db:
+                names.append(projects_mod.get_project(db, "p1").name)
+
+        threads = [threading.Thread(target=read) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert names == ["Project 1"] * 4
+
+    def test_readers_share_connection_pragmas(self, pool):
+        with pool.get_reader() as reader, pool.get_writer() as writer:
+            for pragma in ("cache_size", "mmap_size", "busy_timeout"):
+                value = reader.execute(f"PRAGMA {pragma}").fetchone()[0]
+                assert value == writer.execute(f"PRAGMA {pragma}").fetchone()[0]
+            assert reader.execute("PRAGMA cache_size").fetchone()[0] == -20000
+
+    def test_writer_begins_immediate_transactions(self, pool):
+        with pool.get_writer() as db:
+            assert db.isolation_level == "IMMEDIATE"
@@ -0,0 +1,36 @@
+"""Tests for the Slack integration helpers."""
+
+import pytest
+
+from work_orchestrator.integrations import slack as slack_mod
+
+
+class TestSendMessageAsync:
+    def test_errors_surface_through_future(self):
+        future = slack_mod.send_message_async(None, "#general", "hi")
+        with pytest.raises(slack_mod.SlackError, match="not configured"):
+            future.result(timeout=5)
+
+
+class TestFormatStatusUpdate:
+    def test_counts_task_list(self):
+        tasks = [{"status": "done"}, {"status": "done"}, {"status": "blocked"}, {}]
+        text = slack_mod.format_status_update("demo", tasks)[0]["text"]["text"]
+        assert "Done: 2" in text and "Blocked: 1" in text and "Todo: 1" in text
+        assert "Progress: 50% (2/4)" in text
+
+    def test_accepts_precomputed_counts(self):
+        text = slack_mod.format_status_update("demo", {"done": 1, "review": 1})[0]["text"]["text"]
+        assert "Progress: 50% (1/2)" in text
+
+
+class TestGetClient:
+    def test_no_token(self):
+        assert slack_mod.get_client(None) is None
+
+    def test_client_cached_with_rate_limit_retry(self):
+        from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
+
+        client = slack_mod.get_client("xoxb-test")
+        assert slack_mod.get_client("xoxb-test") is client
+        assert any(isinstance(h, RateLimitErrorRetryHandler) for h in client.retry_handlers)
@@ -32,6 +32,9 @@ class TestSlugify:
     def test_multiple_spaces(self):
         assert tasks_mod.slugify("  too   many   spaces  ") == "too-many-spaces"
 
+    def test_mixed_separator_runs(self):
+        assert tasks_mod.slugify("snake_case - and -- dashes__") == "snake-case-and-dashes"
+
     def test_truncation(self):
         long_title = "a" * 100
         assert len(tasks_mod.slugify(long_title)) <= 60
@@ -51,6 +54,13 @@ class TestTaskCRUD:
         assert t1.id == "build-login-page"
         assert t2.id == "build-login-page-2"
 
+    def test_duplicate_suffix_fills_gaps(self, db):
+        for _ in range(3):
+            tasks_mod.create_task(db, "Deploy", "test")
+        tasks_mod.delete_task(db, "deploy-2")
+        assert tasks_mod.create_task(db, "Deploy", "test").id == "deploy-2"
+        assert tasks_mod.create_task(db, "Deploy", "test").id == "deploy-4"
+
     def test_get_task(self, db):
         tasks_mod.create_task(db, "My task", "test")
         task = tasks_mod.get_task(db, "my-task")
@@ -66,6 +76,13 @@ class TestTaskCRUD:
         tasks = tasks_mod.list_tasks(db, "test")
         assert len(tasks) == 2
 
+    def test_list_tasks_loads_dependencies(self, db):
+        tasks_mod.create_task(db, "Base", "test")
+        tasks_mod.create_task(db, "Other", "test")
+        tasks_mod.create_task(db, "Top", "test", depends_on=["base", "other"])
+        deps = {t.id: sorted(t.depends_on) for t in tasks_mod.list_tasks(db, "test")}
+        assert deps == {"base": [], "other": [], "top": ["base", "other"]}
+
     def test_list_tasks_by_status(self, db):
         tasks_mod.create_task(db, "Task A", "test")
         tasks_mod.create_task(db, "Task B", "test")
@@ -79,6 +96,18 @@ class TestTaskCRUD:
         assert tasks_mod.delete_task(db, "temp-task") is True
         assert tasks_mod.get_task(db, "temp-task") is None
 
+    def test_delete_task_removes_subtree(self, db):
+        tasks_mod.create_task(db, "Parent", "test")
+        subs = tasks_mod.break_down_task(db, "parent", [{"title": "Child"}])
+        tasks_mod.break_down_task(db, subs[0].id, [{"title": "Grandchild"}])
+        tasks_mod.create_task(db, "Other", "test", depends_on=[subs[0].id])
+
+        assert tasks_mod.delete_task(db, "parent") is True
+        remaining = db.execute("SELECT id FROM tasks").fetchall()
+        assert [r["id"] for r in remaining] == ["other"]
+        assert tasks_mod.get_task(db, "other").depends_on == []
+        assert db.execute("SELECT COUNT(*) FROM task_events WHERE task_id != 'other'").fetchone()[0] == 0
+
     def test_delete_nonexistent(self, db):
         assert tasks_mod.delete_task(db, "nope") is False
 
@@ -89,6 +118,15 @@ class TestTaskStatus:
         task = tasks_mod.update_task_status(db, "status-test", "in-progress")
         assert task.status == "in-progress"
 
+    def test_invalid_status_logs_no_event(self, db):
+        tasks_mod.create_task(db, "Bad status", "test")
+        before = len(tasks_mod.get_task_events(db, "bad-status"))
+        with pytest.raises(sqlite3.IntegrityError):
+            tasks_mod.update_task_status(db, "bad-status", "cancelled")
+        db.commit()
+        assert len(tasks_mod.get_task_events(db, "bad-status")) == before
+        assert tasks_mod.get_task(db, "bad-status").status == "todo"
+
     def test_done_sets_completed_at(self, db):
         tasks_mod.create_task(db, "Done test", "test")
         task = tasks_mod.update_task_status(db, "done-test", "done")
@@ -102,6 +140,57 @@ class TestTaskStatus:
         assert events[0].event_type == "created"
         assert events[1].event_type == "status_changed"
 
+    def test_update_status_returning(self, db):
+        tasks_mod.create_task(db, "Returning test", "test")
+        task = tasks_mod.update_task_status_returning(db, "returning-test", "done")
+        assert task.status == "done"
+        assert task.completed_at is not None
+        events = tasks_mod.get_task_events(db, "returning-test")
+        assert (events[-1].old_value, events[-1].new_value) == ("todo", "done")
+
+    def test_update_status_returning_missing_task(self, db):
+        assert tasks_mod.update_task_status_returning(db, "nope", "done") is None
+        assert tasks_mod.get_task_events(db, "nope") == []
+
+    def test_update_status_returning_includes_project(self, db):
+        tasks_mod.create_task(db, "Repo test", "test")
+        task = tasks_mod.update_task_status_returning(db, "repo-test", "in-progress")
+        project = projects_mod.get_project(db, "test")
+        assert task.project_repo_path == project.repo_path
+
+    def test_update_status_returning_without_commit(self, db):
+        tasks_mod.create_task(db, "Batched", "test")
+        tasks_mod.update_task_status_returning(db, "batched", "review", commit=False)
+        assert db.in_transaction
+        db.rollback()
+        assert tasks_mod.get_task(db, "batched").status == "todo"
+
+    def test_status_counts(self, db):
+        tasks_mod.create_task(db, "One", "test")
+        tasks_mod.create_task(db, "Two", "test")
+        tasks_mod.create_task(db, "Three", "test")
+        tasks_mod.update_task_status(db, "one", "done")
+        tasks_mod.break_down_task(db, "two", [{"title": "Sub"}])
+        assert tasks_mod.status_counts(db, "test") == {"todo": 2, "done": 1}
+        assert tasks_mod.status_counts(db, "empty") == {}
+
+
+class TestGetTaskWithProject:
+    def test_joins_project(self, db):
+        tasks_mod.create_task(db, "Joined", "test")
+        task = tasks_mod.get_task_with_project(db, "joined")
+        project = projects_mod.get_project(db, "test")
+        assert task.title == "Joined"
+        assert task.project_repo_path == project.repo_path
+        assert task.project_slack_channel is None
+
+    def test_missing_task(self, db):
+        assert tasks_mod.get_task_with_project(db, "nope") is None
+
+    def test_plain_get_task_has_no_project_fields(self, db):
+        tasks_mod.create_task(db, "Plain", "test")
+        assert tasks_mod.get_task(db, "plain").project_repo_path is None
+
 
 class TestDependencies:
     def test_create_with_deps(self, db):
@@ -130,6 +219,17 @@ class TestDependencies:
         ids = [t.id for t in ready]
         assert "followup" in ids
 
+    def test_blocked_tasks(self, db):
+        tasks_mod.create_task(db, "Prereq", "test")
+        tasks_mod.create_task(db, "Done prereq", "test")
+        tasks_mod.create_task(db, "Waiting", "test", depends_on=["prereq", "done-prereq"])
+        tasks_mod.create_task(db, "Unblocked", "test", depends_on=["done-prereq"])
+        tasks_mod.update_task_status(db, "done-prereq", "done")
+
+        blocked = tasks_mod.get_blocked_tasks(db, "test")
+        assert [t.id for t in blocked] == ["waiting"]
+        assert sorted(blocked[0].depends_on) == ["done-prereq", "prereq"]
+
 
 class TestPriority:
     def test_default_priority(self, db):
@@ -160,6 +260,17 @@ class TestPriority:
         assert prio_events[0].old_value == "3"
         assert prio_events[0].new_value == "0"
 
+    def test_update_missing_task(self, db):
+        assert tasks_mod.update_task_priority(db, "nope", 1) is None
+        assert tasks_mod.update_task_pr_url(db, "nope", "https://x/pr/1") is None
+
+    def test_update_pr_url_logs_old_url(self, db):
+        tasks_mod.create_task(db, "Ship it", "test", pr_url="https://x/pr/1")
+        task = tasks_mod.update_task_pr_url(db, "ship-it", "https://x/pr/2")
+        assert task.pr_url == "https://x/pr/2"
+        events = [e for e in tasks_mod.get_task_events(db, "ship-it") if e.event_type == "pr_url_changed"]
+        assert (events[0].old_value, events[0].new_value) == ("https://x/pr/1", "https://x/pr/2")
+
     def test_list_sorted_by_priority(self, db):
         tasks_mod.create_task(db, "Low prio", "test", priority=5)
         tasks_mod.create_task(db, "High prio", "test", priority=0)
@@ -238,3 +349,67 @@ class TestBreakdown:
         ])
         assert subs[0].priority == 0
         assert subs[1].priority == 3
+
+    def test_break_down_is_atomic(self, db):
+        tasks_mod.create_task(db, "Parent task", "test")
+        with pytest.raises(sqlite3.IntegrityError):
+            tasks_mod.break_down_task(db, "parent-task", [
+                {"title": "Fine sub"},
+                {"title": "Bad sub", "depends_on": ["no-such-task"]},
+            ])
+        assert tasks_mod.get_task(db, "parent-task").subtasks == []
+
+    def test_break_down_missing_parent(self, db):
+        with pytest.raises(ValueError, match="Task not found"):
+            tasks_mod.break_down_task(db, "nope", [{"title": "Orphan"}])
+
+    def test_list_tasks_with_subtasks(self, db):
+        tasks_mod.create_task(db, "Parent A", "test")
+        tasks_mod.create_task(db, "Parent B", "test")
+        tasks_mod.break_down_task(db, "parent-a", [
+            {"title": "Low sub", "priority": 5},
+            {"title": "High sub", "priority": 1},
+        ])
+        tasks_mod.add_dependency(db, "parent-b", "parent-a")
+        tasks = tasks_mod.list_tasks_with_subtasks(db, "test")
+        assert [t.id for t in tasks] == ["parent-a", "parent-b"]
+        assert [s.id for s in tasks[0].subtasks] == ["high-sub", "low-sub"]
+        assert tasks[1].subtasks == []
+        assert tasks[1].depends_on == ["parent-a"]
+
+    def test_list_tasks_with_subtasks_status_filter(self, db):
+        tasks_mod.create_task(db, "Parent A", "test")
+        tasks_mod.create_task(db, "Parent B", "test")
+        tasks_mod.break_down_task(db, "parent-b", [{"title": "Sub"}])
+        tasks_mod.update_task_status(db, "parent-a", "done")
+        tasks = tasks_mod.list_tasks_with_subtasks(db, "test", status="todo")
+        assert [t.id for t in tasks] == ["parent-b"]
+        assert [s.id for s in tasks[0].subtasks] == ["sub"]
+
+    def test_list_subtask_summaries(self, db):
+        tasks_mod.create_task(db, "Parent", "test")
+        tasks_mod.break_down_task(db, "parent", [
+            {"title": "Low sub", "priority": 5},
+            {"title": "High sub", "priority": 1},
+        ])
+        assert tasks_mod.list_subtask_summaries(db, "parent") == [
+            ("high-sub", "High sub", "todo"),
+            ("low-sub", "Low sub", "todo"),
+        ]
+        assert tasks_mod.get_task(db, "parent", include_subtasks=False).subtasks == []
+
+    def test_list_subtasks_by_parents(self, db):
+        tasks_mod.create_task(db, "Parent A", "test")
+        tasks_mod.create_task(db, "Parent B", "test")
+        tasks_mod.create_task(db, "Parent C", "test")
+        tasks_mod.break_down_task(db, "parent-a", [
+            {"title": "Low sub", "priority": 5},
+            {"title": "High sub", "priority": 1, "depends_on": ["parent-c"]},
+        ])
+        tasks_mod.break_down_task(db, "parent-b", [{"title": "B sub"}])
+        subs = tasks_mod.list_subtasks_by_parents(db, "test", ["parent-a", "parent-b", "parent-c"])
+        assert [s.id for s in subs["parent-a"]] == ["high-sub", "low-sub"]
+        assert subs["parent-a"][0].depends_on == ["parent-c"]
+        assert [s.id for s in subs["parent-b"]] == ["b-sub"]
+        assert "parent-c" not in subs
+        assert tasks_mod.list_subtasks_by_parents(db, "test", []) == {}
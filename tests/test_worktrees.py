@@ -11,7 +11,7 @@ from work_orchestrator.core import projects as projects_mod
 from work_orchestrator.core import tasks as tasks_mod
 from work_orchestrator.core import worktrees as worktrees_mod
 from work_orchestrator.db.engine import init_db
-from work_orchestrator.integrations.git import GitError, worktree_list
+from work_orchestrator.integrations.git import worktree_list
 
 
 @pytest.fixture
@@ -99,6 +99,83 @@ class TestWorktreeLifecycle:
         assert len(results) == 1
         assert results[0]["removed"] is True
 
+    def test_cleanup_detaches_others_when_one_fails(self, db, git_repo, monkeypatch):
+        ids = ["ok-a", "broken", "ok-b"]
+        for task_id in ids:
+            tasks_mod.create_task(db, task_id.replace("-", " ").title(), "test")
+            worktrees_mod.create_worktree_for_task(db, task_id, git_repo)
+            tasks_mod.update_task_status(db, task_id, "done")
+
+        remove_files = worktrees_mod._remove_worktree_files
+
+        def flaky_remove(repo, wt_path, *args):
+            if wt_path.name == "task-broken":
+                raise PermissionError("permission denied")
+            return remove_files(repo, wt_path, *args)
+
+        monkeypatch.setattr(worktrees_mod, "_remove_worktree_files", flaky_remove)
+        results = {r["task_id"]: r for r in worktrees_mod.cleanup_done_worktrees(db, git_repo, "test")}
+        assert results["broken"]["removed"] is False
+        assert "permission denied" in results["broken"]["reason"]
+        assert tasks_mod.get_task(db, "broken").worktree_path is not None
+        for task_id in ("ok-a", "ok-b"):
+            assert results[task_id]["removed"] is True
+            assert tasks_mod.get_task(db, task_id).worktree_path is None
+
+    def test_cleanup_many_done_worktrees(self, db, git_repo):
+        ids = ["many-a", "many-b", "many-c"]
+        for task_id in ids:
+            tasks_mod.create_task(db, task_id.replace("-", " ").title(), "test")
+            worktrees_mod.create_worktree_for_task(db, task_id, git_repo)
+            tasks_mod.update_task_status(db, task_id, "done")
+        tasks_mod.create_task(db, "Still open", "test")
+        worktrees_mod.create_worktree_for_task(db, "still-open", git_repo)
+
+        results = worktrees_mod.cleanup_done_worktrees(db, git_repo, "test")
+        assert sorted(r["task_id"] for r in results) == ids
+        assert all(r["removed"] for r in results)
+        for task_id in ids:
+            assert tasks_mod.get_task(db, task_id).worktree_path is None
+            events = tasks_mod.get_task_events(db, task_id)
+            assert events[-1].event_type == "worktree_removed"
+        assert tasks_mod.get_task(db, "still-open").worktree_path is not None
+        assert len(worktrees_mod.list_task_worktrees(db, git_repo)) == 2  # main + still-open
+
+
+class TestWorktreeList:
+    def test_lists_branch_and_detached_worktrees(self, git_repo):
+        repo = Path(git_repo)
+        subprocess.run(["git", "worktree", "add", "-b", "feat", str(repo / "wt-feat")],
+                       cwd=repo, capture_output=True, check=True)
+        subprocess.run(["git", "worktree", "add", "--detach", str(repo / "wt-detached")],
+                       cwd=repo, capture_output=True, check=True)
+        subprocess.run(["git", "worktree", "lock", str(repo / "wt-feat")],
+                       cwd=repo, capture_output=True, check=True)
+
+        worktrees = worktree_list(repo)
+        branches = {Path(w.path).name: w.branch for w in worktrees}
+        assert branches == {repo.name: "main", "wt-feat": "feat", "wt-detached": ""}
+        assert all(len(w.head) == 40 and not w.is_bare for w in worktrees)
+
+    def test_keeps_non_utf8_path(self, git_repo):
+        repo = Path(git_repo)
+        wt = repo / os.fsdecode(b"wt-\xff")
+        subprocess.run(["git", "worktree", "add", "--detach", str(wt)],
+                       cwd=repo, capture_output=True, check=True)
+
+        paths = {Path(w.path) for w in worktree_list(repo)}
+        assert wt in paths
+        assert wt.exists()
+
+    def test_lists_bare_repo(self, git_repo):
+        with tempfile.TemporaryDirectory() as tmp:
+            bare = Path(tmp) / "bare.git"
+            subprocess.run(["git", "clone", "--bare", git_repo, str(bare)],
+                           capture_output=True, check=True)
+            worktrees = worktree_list(bare)
+        assert len(worktrees) == 1
+        assert worktrees[0].is_bare and worktrees[0].head == ""
+
 
 class TestWorktreeErrors:
     def test_create_for_nonexistent_task(self, db, git_repo):